@@ -22,15 +22,14 @@ from __future__ import annotations
 
 import argparse
 import sys
-from typing import Optional
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Optional
 
-from .pipeline import (
-    run_pipeline,
-    get_last_result,
-    set_last_result,
-    PipelineResult,
-)
-from ..ranking.scorer import RankedLead, LeadTier
+# The pipeline pulls in every phase of the engine. Commands import it on
+# first use so `glassbox --help` and argument errors only load argparse.
+if TYPE_CHECKING:
+    from ..ranking.scorer import RankedLead, LeadTier
 
 
 # =============================================================================
@@ -39,23 +38,25 @@ from ..ranking.scorer import RankedLead, LeadTier
 
 def format_tier_badge(tier: LeadTier) -> str:
     """Format tier as a visual badge."""
-    badges = {
-        LeadTier.TIER_A: "[A-TIER]",
-        LeadTier.TIER_B: "[B-TIER]",
-        LeadTier.TIER_C: "[C-TIER]",
-        LeadTier.TIER_D: "[D-TIER]",
-    }
-    return badges.get(tier, "[?-TIER]")
+    return tier.badge
 
 
 def format_lead_row(lead_id: str, lead: RankedLead) -> str:
     """Format a single lead for display."""
-    tier = format_tier_badge(lead.tier)
-    company = lead.entity.get_name_value()
-    domain = lead.entity.get_domain_value()
-    score = lead.score
-    
-    return f"{tier} | Score: {score:>5.0f} | {company} ({domain}) | ID: {lead_id}"
+    entity = lead.entity
+    breakdown = lead.breakdown
+    tier = format_tier_badge(breakdown.tier)
+    score = breakdown.total_score
+    
+    return (
+        f"{tier} | Score: {score:>5.0f} | "
+        f"{entity.get_name_value()} ({entity.get_domain_value()}) | ID: {lead_id}"
+    )
+
+
+def write_lines(lines: list[str]) -> None:
+    """Write a block of output lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def format_explanation(lead: RankedLead) -> str:
@@ -65,50 +66,59 @@ def format_explanation(lead: RankedLead) -> str:
 
 def format_evidence_lineage(lead: RankedLead) -> str:
     """Format the evidence lineage for a lead."""
-    lines = []
-    
-    company = lead.entity.get_name_value()
-    lines.append(f"Evidence Lineage for: {company}")
-    lines.append("=" * 50)
+    entity = lead.entity
+    name_ev = entity.company_name
+    domain_ev = entity.domain
+    industry_ev = entity.industry
+    size_ev = entity.size_estimate
+    signal = lead.signal
     
     # Entity evidence
-    lines.append("")
-    lines.append("ENTITY EVIDENCE:")
-    lines.append(f"  • company_name: {lead.entity.company_name.value}")
-    lines.append(f"    ID: {lead.entity.company_name.evidence_id}")
-    lines.append(f"    Type: {lead.entity.company_name.evidence_type.value}")
-    lines.append(f"    Confidence: {lead.entity.company_name.meta.confidence:.0%}")
-    
-    lines.append("")
-    lines.append(f"  • domain: {lead.entity.domain.value}")
-    lines.append(f"    ID: {lead.entity.domain.evidence_id}")
-    lines.append(f"    Type: {lead.entity.domain.evidence_type.value}")
-    lines.append(f"    Confidence: {lead.entity.domain.meta.confidence:.0%}")
-    
-    if lead.entity.industry:
-        lines.append("")
-        lines.append(f"  • industry: {lead.entity.industry.value}")
-        lines.append(f"    ID: {lead.entity.industry.evidence_id}")
-        lines.append(f"    Inference rule: {lead.entity.industry.meta.inference_rule}")
-    
-    if lead.entity.size_estimate:
-        lines.append("")
-        lines.append(f"  • size_estimate: {lead.entity.size_estimate.value}")
-        lines.append(f"    ID: {lead.entity.size_estimate.evidence_id}")
-        lines.append(f"    Inference rule: {lead.entity.size_estimate.meta.inference_rule}")
+    lines = [
+        f"Evidence Lineage for: {entity.get_name_value()}",
+        "=" * 50,
+        "",
+        "ENTITY EVIDENCE:",
+        f"  • company_name: {name_ev.value}",
+        f"    ID: {name_ev.evidence_id}",
+        f"    Type: {name_ev.evidence_type.value}",
+        f"    Confidence: {name_ev.meta.confidence:.0%}",
+        "",
+        f"  • domain: {domain_ev.value}",
+        f"    ID: {domain_ev.evidence_id}",
+        f"    Type: {domain_ev.evidence_type.value}",
+        f"    Confidence: {domain_ev.meta.confidence:.0%}",
+    ]
+    
+    if industry_ev:
+        lines += [
+            "",
+            f"  • industry: {industry_ev.value}",
+            f"    ID: {industry_ev.evidence_id}",
+            f"    Inference rule: {industry_ev.meta.inference_rule}",
+        ]
+    
+    if size_ev:
+        lines += [
+            "",
+            f"  • size_estimate: {size_ev.value}",
+            f"    ID: {size_ev.evidence_id}",
+            f"    Inference rule: {size_ev.meta.inference_rule}",
+        ]
     
     # Signal evidence
-    if lead.signal:
-        lines.append("")
-        lines.append("SIGNAL EVIDENCE:")
-        lines.append(f"  • Source: {lead.signal.source_url}")
-        lines.append(f"  • Signal ID: {lead.signal.signal_id}")
-        lines.append(f"  • Timestamp: {lead.signal.timestamp}")
-        lines.append(f"  • Text: {lead.signal.raw_text[:200]}...")
+    if signal:
+        lines += [
+            "",
+            "SIGNAL EVIDENCE:",
+            f"  • Source: {signal.source_url}",
+            f"  • Signal ID: {signal.signal_id}",
+            f"  • Timestamp: {signal.timestamp}",
+            f"  • Text: {signal.raw_text[:200]}...",
+        ]
     
     # Scoring components
-    lines.append("")
-    lines.append("SCORING COMPONENTS:")
+    lines += ["", "SCORING COMPONENTS:"]
     for component in lead.breakdown.components:
         sign = "+" if component.contribution >= 0 else ""
         lines.append(f"  • {component.name}: {sign}{component.contribution:.0f}")
@@ -125,6 +135,8 @@ def format_evidence_lineage(lead: RankedLead) -> str:
 
 def cmd_run(args: argparse.Namespace) -> int:
     """Execute the full pipeline."""
+    from .pipeline import run_pipeline, set_last_result
+    
     print("GlassBox Discovery Engine")
     print("=" * 50)
     print("Running pipeline...")
@@ -134,26 +146,31 @@ def cmd_run(args: argparse.Namespace) -> int:
         result = run_pipeline()
         set_last_result(result)
         
-        print(f"Pipeline completed at: {result.run_timestamp}")
-        print()
-        print("STATISTICS:")
-        print(f"  Signals processed: {result.total_signals_processed}")
-        print(f"  Signals accepted:  {result.signals_accepted}")
-        print(f"  Signals rejected:  {result.signals_rejected}")
-        print(f"  Entities resolved: {result.entities_resolved}")
-        print(f"  Entities rejected: {result.entities_rejected}")
-        print(f"  Final leads:       {len(result.ranked_leads)}")
-        print()
+        lines = [
+            f"Pipeline completed at: {result.run_timestamp}",
+            "",
+            "STATISTICS:",
+            f"  Signals processed: {result.total_signals_processed}",
+            f"  Signals accepted:  {result.signals_accepted}",
+            f"  Signals rejected:  {result.signals_rejected}",
+            f"  Entities resolved: {result.entities_resolved}",
+            f"  Entities rejected: {result.entities_rejected}",
+            f"  Final leads:       {len(result.ranked_leads)}",
+            "",
+        ]
         
         if result.rejections:
-            print("REJECTIONS (for audit):")
-            for rejection in result.rejections[:5]:  # Show first 5
-                print(f"  • [{rejection.rule.value}] {rejection.reason[:60]}...")
+            lines.append("REJECTIONS (for audit):")
+            lines += [
+                f"  • {rejection.display_line}"
+                for rejection in islice(result.rejections, 5)  # Show first 5
+            ]
             if len(result.rejections) > 5:
-                print(f"  ... and {len(result.rejections) - 5} more")
-            print()
+                lines.append(f"  ... and {len(result.rejections) - 5} more")
+            lines.append("")
         
-        print("Run 'glassbox leads' to see ranked leads.")
+        lines.append("Run 'glassbox leads' to see ranked leads.")
+        write_lines(lines)
         return 0
         
     except Exception as e:
@@ -164,6 +181,8 @@ def cmd_run(args: argparse.Namespace) -> int:
 
 def cmd_leads(args: argparse.Namespace) -> int:
     """Show ranked leads."""
+    from .pipeline import get_last_result
+    
     result = get_last_result()
     
     if result is None:
@@ -171,29 +190,39 @@ def cmd_leads(args: argparse.Namespace) -> int:
         print("Run 'glassbox run' first.")
         return 1
     
-    print("GlassBox — Ranked Leads")
-    print("=" * 70)
-    print()
+    lines = [
+        "GlassBox — Ranked Leads",
+        "=" * 70,
+        "",
+    ]
     
     if not result.ranked_leads:
-        print("No leads found.")
+        lines.append("No leads found.")
+        write_lines(lines)
         return 0
     
-    lead_ids = result.get_lead_ids()
-    
-    for lead_id, lead in lead_ids:
-        print(format_lead_row(lead_id, lead))
-    
-    print()
-    print(f"Total: {len(result.ranked_leads)} leads")
-    print()
-    print("Use 'glassbox explain <id>' for detailed explanation.")
+    lines.append(result.get_rendered(
+        "lead_rows",
+        lambda: "\n".join(
+            format_lead_row(lead_id, lead)
+            for lead_id, lead in result.get_lead_ids()
+        ),
+    ))
+    lines.extend([
+        "",
+        f"Total: {len(result.ranked_leads)} leads",
+        "",
+        "Use 'glassbox explain <id>' for detailed explanation.",
+    ])
+    write_lines(lines)
     
     return 0
 
 
 def cmd_explain(args: argparse.Namespace) -> int:
     """Show explanation for a specific lead."""
+    from .pipeline import get_last_result
+    
     result = get_last_result()
     
     if result is None:
@@ -222,6 +251,8 @@ def cmd_explain(args: argparse.Namespace) -> int:
 
 def cmd_evidence(args: argparse.Namespace) -> int:
     """Show evidence lineage for a specific lead."""
+    from .pipeline import get_last_result
+    
     result = get_last_result()
     
     if result is None:
@@ -240,7 +271,10 @@ def cmd_evidence(args: argparse.Namespace) -> int:
             print(f"  {lid} — {l.entity.get_name_value()}")
         return 1
     
-    print(format_evidence_lineage(lead))
+    print(result.get_rendered(
+        f"evidence:{lead_id}",
+        lambda: format_evidence_lineage(lead),
+    ))
     
     return 0
 
@@ -249,8 +283,31 @@ def cmd_evidence(args: argparse.Namespace) -> int:
 # MAIN ENTRY POINT
 # =============================================================================
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create the CLI argument parser."""
+# Subcommand table: name -> (help, handler, lead_id help or None).
+# Kept as data so create_parser can register only the subparser it needs.
+_COMMANDS = {
+    "run": ("Execute the full pipeline", cmd_run, None),
+    "leads": ("Show ranked leads", cmd_leads, None),
+    "explain": ("Show explanation for a lead", cmd_explain, "Lead ID to explain"),
+    "evidence": (
+        "Show evidence lineage for a lead",
+        cmd_evidence,
+        "Lead ID to show evidence for",
+    ),
+}
+
+
+def create_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Create the CLI argument parser.
+    
+    If command names a known subcommand, only that subparser is built.
+    Otherwise (no command, --help, typos) all subparsers are registered
+    so help output and error messages stay complete.
+    
+    Each call returns a new parser the caller is free to modify; main()
+    reuses private cached instances instead (see _cached_parser).
+    """
     parser = argparse.ArgumentParser(
         prog="glassbox",
         description="GlassBox Discovery Engine — Explainable Lead Discovery",
@@ -262,48 +319,64 @@ def create_parser() -> argparse.ArgumentParser:
         dest="command",
     )
     
-    # Run command
-    run_parser = subparsers.add_parser(
-        "run",
-        help="Execute the full pipeline",
-    )
-    run_parser.set_defaults(func=cmd_run)
+    names = [command] if command in _COMMANDS else list(_COMMANDS)
+    for name in names:
+        help_text, handler, lead_id_help = _COMMANDS[name]
+        command_parser = subparsers.add_parser(name, help=help_text)
+        if lead_id_help is not None:
+            command_parser.add_argument("lead_id", help=lead_id_help)
+        command_parser.set_defaults(func=handler)
     
-    # Leads command
-    leads_parser = subparsers.add_parser(
-        "leads",
-        help="Show ranked leads",
-    )
-    leads_parser.set_defaults(func=cmd_leads)
+    return parser
+
+
+@lru_cache(maxsize=len(_COMMANDS) + 1)
+def _cached_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    """
+    Parser for main(), shared across calls in one process.
     
-    # Explain command
-    explain_parser = subparsers.add_parser(
-        "explain",
-        help="Show explanation for a lead",
-    )
-    explain_parser.add_argument(
-        "lead_id",
-        help="Lead ID to explain",
-    )
-    explain_parser.set_defaults(func=cmd_explain)
+    Keyed only by a known command or None, so the cache holds at most
+    one parser per subcommand plus the full one. parse_args never
+    mutates a parser, and the instance never leaves this module.
+    """
+    return create_parser(command)
+
+
+def parse_fast_path(argv: list[str]) -> Optional[argparse.Namespace]:
+    """
+    Parse the documented invocations without building a parser.
     
-    # Evidence command
-    evidence_parser = subparsers.add_parser(
-        "evidence",
-        help="Show evidence lineage for a lead",
-    )
-    evidence_parser.add_argument(
-        "lead_id",
-        help="Lead ID to show evidence for",
-    )
-    evidence_parser.set_defaults(func=cmd_evidence)
+    Handles exactly `run`, `leads`, `explain <id>` and `evidence <id>`.
+    Anything else (flags, missing or extra arguments, unknown commands)
+    returns None and goes through argparse for help and error messages.
+    """
+    if not argv or argv[0] not in _COMMANDS:
+        return None
     
-    return parser
+    command = argv[0]
+    _, handler, lead_id_help = _COMMANDS[command]
+    
+    if lead_id_help is None:
+        if len(argv) != 1:
+            return None
+        return argparse.Namespace(command=command, func=handler)
+    
+    if len(argv) != 2 or argv[1].startswith("-"):
+        return None
+    return argparse.Namespace(command=command, func=handler, lead_id=argv[1])
 
 
 def main(argv: Optional[list[str]] = None) -> int:
     """Main entry point for the CLI."""
-    parser = create_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    args = parse_fast_path(argv)
+    if args is not None:
+        return args.func(args)
+    
+    command = argv[0] if argv else None
+    parser = _cached_parser(command if command in _COMMANDS else None)
     args = parser.parse_args(argv)
     
     if args.command is None:
@@ -10,27 +10,43 @@ Pipeline stages:
     4. Lead Ranking (Phase 4)
 
 The pipeline is read-only and deterministic.
-No configuration. No tuning. No persistence.
+No configuration. No tuning. No persistence beyond a cache of the
+last run, so separate CLI invocations can read it back.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
-import hashlib
+from functools import lru_cache
+from hashlib import blake2b
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
+import os
+import pickle
 
-from ..domain import Entity, Signal, Rejection
-from ..ingestion.rss import ingest_rss_feed, BatchIngestionResult
-from ..resolution.entity_resolver import resolve_signals, BatchResolutionResult
-from ..enrichment.waterfall import enrich_entities, EnrichmentResult
+from ..ingestion.rss import ingest_rss_feed
+from ..resolution.entity_resolver import resolve_signals
+from ..enrichment.waterfall import enrich_entity
+from ..evidence import utc_now
 from ..ranking.scorer import score_leads, RankedLead
 
+if TYPE_CHECKING:
+    from collections.abc import MutableSet
+    from ..domain import Entity, Signal, Rejection
+
 
 # =============================================================================
 # PIPELINE RESULT
 # =============================================================================
 
+@lru_cache(maxsize=4096)
+def _lead_id_for_domain(domain: str) -> str:
+    """Hash a domain into a short lead ID (pure, so memoized)."""
+    # 4-byte digest gives exactly 8 hex chars, no truncation needed
+    return blake2b(domain.encode("utf-8"), digest_size=4).hexdigest()
+
+
 @dataclass
 class PipelineResult:
     """
@@ -52,28 +68,57 @@ class PipelineResult:
     entities_rejected: int = 0
     
     # Metadata
-    run_timestamp: datetime = field(default_factory=datetime.utcnow)
+    run_timestamp: datetime = field(default_factory=utc_now)
+    
+    # Lead ID index, built once from ranked_leads (not part of the result)
+    _lead_ids: list[tuple[str, RankedLead]] = field(
+        init=False, repr=False, compare=False,
+    )
+    _leads_by_id: dict[str, RankedLead] = field(
+        init=False, repr=False, compare=False,
+    )
+    
+    # Rendered CLI views, keyed by view name
+    _rendered: dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False,
+    )
+    
+    def __post_init__(self):
+        """Index leads by ID so lookups don't rescan and rehash."""
+        self._lead_ids = [
+            (self._generate_lead_id(lead), lead)
+            for lead in self.ranked_leads
+        ]
+        self._leads_by_id = {}
+        for lead_id, lead in self._lead_ids:
+            # First (highest-ranked) lead wins, matching a linear scan
+            self._leads_by_id.setdefault(lead_id, lead)
     
     def get_lead_by_id(self, lead_id: str) -> Optional[RankedLead]:
         """Find a lead by its ID."""
-        for lead in self.ranked_leads:
-            if self._generate_lead_id(lead) == lead_id:
-                return lead
-        return None
+        return self._leads_by_id.get(lead_id)
     
     @staticmethod
     def _generate_lead_id(lead: RankedLead) -> str:
         """Generate a stable ID for a lead."""
         # Use domain as the stable identifier
-        domain = lead.entity.get_domain_value()
-        return hashlib.md5(domain.encode()).hexdigest()[:8]
+        return _lead_id_for_domain(lead.entity.get_domain_value())
     
     def get_lead_ids(self) -> list[tuple[str, RankedLead]]:
         """Get all leads with their IDs."""
-        return [
-            (self._generate_lead_id(lead), lead)
-            for lead in self.ranked_leads
-        ]
+        return list(self._lead_ids)
+    
+    def get_rendered(self, key: str, render: Callable[[], str]) -> str:
+        """
+        Return a rendered view of this result, building it on first use.
+        
+        A result never changes after the pipeline returns it, so each
+        view is deterministic and only needs to be formatted once.
+        """
+        text = self._rendered.get(key)
+        if text is None:
+            text = self._rendered[key] = render()
+        return text
 
 
 # =============================================================================
@@ -111,9 +156,27 @@ SAMPLE_RSS_XML = """<?xml version="1.0" encoding="UTF-8"?>
 # PIPELINE EXECUTION
 # =============================================================================
 
+def enrich_batch(
+    entities: list[Entity],
+    signals: list[Signal],
+) -> list[Entity]:
+    """
+    Enrich each Entity with its paired Signal, preserving order.
+    
+    All enrichment Evidence in the batch shares one timestamp.
+    """
+    now = utc_now()
+    
+    return [
+        enrich_entity(entity, signal, now).entity
+        for entity, signal in zip(entities, signals)
+    ]
+
+
 def run_pipeline(
     rss_xml: Optional[str] = None,
     source_url: str = "https://demo.glassbox.local/feed.xml",
+    seen_hashes: Optional[MutableSet[str]] = None,
 ) -> PipelineResult:
     """
     Execute the full GlassBox pipeline.
@@ -127,6 +190,9 @@ def run_pipeline(
     Args:
         rss_xml: RSS feed content (uses sample data if None)
         source_url: URL of the RSS source
+        seen_hashes: Optional set of signal dedup hashes from earlier runs.
+            Repeats are dropped at ingestion, before resolution and
+            enrichment; hashes accepted in this run are added to the set.
     
     Returns:
         PipelineResult with ranked leads and audit information
@@ -140,7 +206,7 @@ def run_pipeline(
     # ==========================================================================
     # STAGE 1: Signal Ingestion (Phase 1)
     # ==========================================================================
-    ingestion_result = ingest_rss_feed(rss_xml, source_url)
+    ingestion_result = ingest_rss_feed(rss_xml, source_url, seen_hashes)
     
     # Collect rejections
     all_rejections.extend(ingestion_result.rejected)
@@ -157,27 +223,14 @@ def run_pipeline(
     
     resolved_entities = resolution_result.resolved
     
-    # Track which signal goes with which entity (for enrichment and ranking)
-    # Since we process in order, signals[i] corresponds to entities[i]
-    entity_signal_pairs: list[tuple[Entity, Signal]] = []
-    signal_idx = 0
-    for entity in resolved_entities:
-        # Find the corresponding signal
-        if signal_idx < len(accepted_signals):
-            entity_signal_pairs.append((entity, accepted_signals[signal_idx]))
-        signal_idx += 1
-    
     # ==========================================================================
     # STAGE 3: Waterfall Enrichment (Phase 3)
     # ==========================================================================
-    enriched_entities = []
-    enriched_signals = []
-    
-    for entity, signal in entity_signal_pairs:
-        from ..enrichment.waterfall import enrich_entity
-        result = enrich_entity(entity, signal)
-        enriched_entities.append(result.entity)
-        enriched_signals.append(signal)
+    # Each entity is enriched with the signal it was resolved from.
+    # Rejected signals are skipped by resolution, so the pairing must come
+    # from resolved_signals rather than from accepted_signals by position.
+    enriched_signals = resolution_result.resolved_signals
+    enriched_entities = enrich_batch(resolved_entities, enriched_signals)
     
     # ==========================================================================
     # STAGE 4: Lead Ranking (Phase 4)
@@ -202,19 +255,109 @@ def run_pipeline(
 
 
 # =============================================================================
-# GLOBAL STATE (In-Memory, Not Persisted)
+# LAST-RUN CACHE (In-Memory, Mirrored to a Cache File)
 # =============================================================================
 
-# Most recent pipeline result (for CLI/API access)
-_last_result: Optional[PipelineResult] = None
+def default_cache_path() -> Path:
+    """Location of the last-run cache file ($XDG_CACHE_HOME/glassbox)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "glassbox" / "last_result.pkl"
+
+
+def _is_private_file(st: os.stat_result) -> bool:
+    """True if the file is owned by this user with no group/other access."""
+    if not hasattr(os, "getuid"):
+        # No POSIX ownership or mode bits to check (e.g. Windows)
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+class ResultStore:
+    """
+    Holds the most recent PipelineResult for CLI access.
+    
+    Every CLI command is a separate process, so the result is also
+    pickled to a cache file that later commands read back instead of
+    re-running the pipeline. This is a cache of one run, not storage:
+    each `glassbox run` overwrites it and the pipeline never reads it.
+    
+    The file is written owner-only (0o600, in a 0o700 directory), and a
+    file that is not owned by the current user, or that group/other can
+    access, is never unpickled. Cache I/O is best-effort; if it fails,
+    the in-memory result is still served.
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        self._path = path
+        self._result: Optional[PipelineResult] = None
+        self._mtime_ns: Optional[int] = None
+    
+    @property
+    def path(self) -> Path:
+        return self._path if self._path is not None else default_cache_path()
+    
+    def get(self) -> Optional[PipelineResult]:
+        """Return the last result, reloading if the cache file changed."""
+        path = self.path
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return self._result
+        
+        if mtime_ns != self._mtime_ns:
+            try:
+                with open(path, "rb") as f:
+                    # Unpickling runs code, so only trust a file nobody
+                    # else can write; check the file actually opened
+                    st = os.fstat(f.fileno())
+                    if not _is_private_file(st):
+                        return self._result
+                    result = pickle.load(f)
+                mtime_ns = st.st_mtime_ns
+            except Exception:
+                # Unreadable or written by an incompatible version
+                return self._result
+            if isinstance(result, PipelineResult):
+                self._result = result
+                self._mtime_ns = mtime_ns
+        
+        return self._result
+    
+    def set(self, result: Optional[PipelineResult]) -> None:
+        """Store a result (or clear it with None) in memory and on disk."""
+        self._result = result
+        self._mtime_ns = None
+        path = self.path
+        
+        try:
+            if result is None:
+                path.unlink(missing_ok=True)
+                return
+            
+            path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            # Create afresh so a leftover temp file's mode is never reused
+            tmp_path.unlink(missing_ok=True)
+            fd = os.open(
+                tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600,
+            )
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            self._mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            pass
+
+
+# Process-wide store used by the CLI
+_store = ResultStore()
 
 
 def get_last_result() -> Optional[PipelineResult]:
     """Get the most recent pipeline result."""
-    return _last_result
+    return _store.get()
 
 
-def set_last_result(result: PipelineResult) -> None:
+def set_last_result(result: Optional[PipelineResult]) -> None:
     """Store the most recent pipeline result."""
-    global _last_result
-    _last_result = result
+    _store.set(result)
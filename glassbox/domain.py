@@ -14,15 +14,17 @@ Domain Objects:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import Iterator, Optional
 
 from .evidence import (
     Evidence,
     EvidenceType,
     EvidenceValidationError,
     create_observation,
+    utc_now,
 )
 
 
@@ -89,7 +91,7 @@ class Rejection:
     ) -> Rejection:
         """Create a Rejection from a RejectionError."""
         if timestamp is None:
-            timestamp = datetime.utcnow()
+            timestamp = utc_now()
         
         return cls(
             rejection_id=rejection_id,
@@ -99,12 +101,23 @@ class Rejection:
             raw_signal_snippet=raw_signal[:500],
             timestamp=timestamp,
         )
+    
+    @cached_property
+    def display_line(self) -> str:
+        """One-line audit summary for listings (reason truncated)."""
+        return f"[{self.rule.value}] {self.reason[:60]}..."
 
 
 # =============================================================================
 # SIGNAL
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def _max_age(days: int) -> timedelta:
+    """Shared timedelta for a max-age window (few distinct values)."""
+    return timedelta(days=days)
+
+
 class IntentType(Enum):
     """Types of time-sensitive intent signals."""
     HIRING = "hiring"
@@ -112,7 +125,7 @@ class IntentType(Enum):
     EXECUTIVE_CHANGE = "executive_change"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Signal:
     """
     A raw business event from a curated source.
@@ -154,11 +167,20 @@ class Signal:
                 self.signal_id,
             )
     
-    def is_stale(self, max_age_days: int = 30) -> bool:
-        """Check if signal is older than max_age_days."""
-        from datetime import timedelta
-        age = datetime.utcnow() - self.timestamp
-        return age > timedelta(days=max_age_days)
+    def is_stale(
+        self,
+        max_age_days: int = 30,
+        reference_time: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Check if signal is older than max_age_days.
+        
+        Batch callers can pass one reference_time for every signal
+        instead of reading the clock per signal.
+        """
+        if reference_time is None:
+            reference_time = utc_now()
+        return reference_time - self.timestamp > _max_age(max_age_days)
     
     def to_evidence(self, field_name: str = "raw_signal") -> Evidence:
         """Convert signal to Evidence Object for storage."""
@@ -175,7 +197,7 @@ class Signal:
 # ENTITY (Company)
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """
     A resolved company entity.
@@ -189,15 +211,25 @@ class Entity:
     Optional fields:
         - industry
         - size_estimate
+    
+    The required fields are fixed once the Entity is resolved; enrichment
+    only fills the optional ones. Their string values are cached at
+    construction for the display paths that read them repeatedly.
     """
     company_name: Evidence
     domain: Evidence
     industry: Optional[Evidence] = None
     size_estimate: Optional[Evidence] = None
     
+    # Cached string views of the required Evidence values
+    _name_str: str = field(init=False, repr=False, compare=False)
+    _domain_str: str = field(init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Validate entity requirements."""
         self._validate_required_evidence()
+        self._name_str = str(self.company_name.value)
+        self._domain_str = str(self.domain.value)
     
     def _validate_required_evidence(self) -> None:
         """
@@ -227,11 +259,11 @@ class Entity:
     
     def get_domain_value(self) -> str:
         """Extract the domain string value."""
-        return str(self.domain.value)
+        return self._domain_str
     
     def get_name_value(self) -> str:
         """Extract the company name string value."""
-        return str(self.company_name.value)
+        return self._name_str
 
 
 # =============================================================================
@@ -253,7 +285,14 @@ class Tier(Enum):
     UNQUALIFIED = 0  # Fails minimum requirements
 
 
-@dataclass
+# Tier lookup indexed by (has_hiring << 2) | (has_tech_stack << 1) | has_verified_email
+_TIER_TABLE: tuple[Tier, ...] = (
+    Tier.UNQUALIFIED, Tier.UNQUALIFIED, Tier.UNQUALIFIED, Tier.UNQUALIFIED,
+    Tier.TIER_3, Tier.TIER_3, Tier.TIER_2, Tier.TIER_1,
+)
+
+
+@dataclass(slots=True)
 class Lead:
     """
     A qualified prospect with evidence-backed fields.
@@ -285,18 +324,22 @@ class Lead:
     tier: Tier = field(default=Tier.UNQUALIFIED)
     
     # Metadata
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=utc_now)
+    updated_at: datetime = field(default_factory=utc_now)
+    
+    # Intent timestamp as a float, converted once for repeated sorts
+    _signal_sort_ts: float = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate lead requirements and compute tier."""
-        self._validate_required_evidence()
-        self._validate_intent_signal_freshness()
+        self._validate()
         self.tier = self._compute_tier()
+        self._signal_sort_ts = self.intent_signal.meta.timestamp.timestamp()
     
-    def _validate_required_evidence(self) -> None:
+    def _validate(self) -> None:
         """
-        Enforce: Required fields must have Evidence Objects.
+        Enforce: Required fields must have Evidence Objects and the
+        intent signal must be ≤ 30 days old.
         Violation triggers HARD REJECT.
         """
         if self.company_name is None:
@@ -316,22 +359,20 @@ class Lead:
             )
         
         # Validate field names
-        expected = [
-            (self.company_name, "company_name"),
-            (self.domain, "domain"),
-            (self.intent_signal, "intent_signal"),
-        ]
-        for evidence, expected_name in expected:
-            if evidence.field_name != expected_name:
-                raise EvidenceValidationError(
-                    f"Expected field_name '{expected_name}', got '{evidence.field_name}'"
-                )
-    
-    def _validate_intent_signal_freshness(self) -> None:
-        """
-        Enforce: Intent signal must be ≤ 30 days old.
-        Stale signals trigger HARD REJECT.
-        """
+        if self.company_name.field_name != "company_name":
+            raise EvidenceValidationError(
+                f"Expected field_name 'company_name', got '{self.company_name.field_name}'"
+            )
+        if self.domain.field_name != "domain":
+            raise EvidenceValidationError(
+                f"Expected field_name 'domain', got '{self.domain.field_name}'"
+            )
+        if self.intent_signal.field_name != "intent_signal":
+            raise EvidenceValidationError(
+                f"Expected field_name 'intent_signal', got '{self.intent_signal.field_name}'"
+            )
+        
+        # Stale intent signals are rejected outright
         if self.intent_signal.is_stale():
             raise RejectionError(
                 RejectionRule.R2_STALE_SIGNAL,
@@ -353,14 +394,9 @@ class Lead:
             and self.contact_email.meta.validated
         )
         
-        if has_hiring and has_tech_stack and has_verified_email:
-            return Tier.TIER_1
-        elif has_hiring and has_tech_stack:
-            return Tier.TIER_2
-        elif has_hiring:
-            return Tier.TIER_3
-        else:
-            return Tier.UNQUALIFIED
+        return _TIER_TABLE[
+            (has_hiring << 2) | (has_tech_stack << 1) | has_verified_email
+        ]
     
     def get_sort_key(self) -> tuple:
         """
@@ -371,7 +407,6 @@ class Lead:
         2. Email confidence (highest first) — negated for descending
         3. Company name (alphabetical, for stability)
         """
-        signal_timestamp = self.intent_signal.meta.timestamp.timestamp()
         email_confidence = (
             self.contact_email.meta.confidence 
             if self.contact_email else 0.0
@@ -379,7 +414,7 @@ class Lead:
         company_name = self.company_name.value
         
         # Negate for descending order
-        return (-signal_timestamp, -email_confidence, company_name)
+        return (-self._signal_sort_ts, -email_confidence, company_name)
     
     def has_contact(self) -> bool:
         """Check if lead has contact information."""
@@ -387,15 +422,16 @@ class Lead:
     
     def get_evidence_ids(self) -> list[str]:
         """Get all evidence IDs associated with this lead."""
-        ids = [
-            self.company_name.evidence_id,
-            self.domain.evidence_id,
-            self.intent_signal.evidence_id,
-        ]
+        return list(self.iter_evidence_ids())
+    
+    def iter_evidence_ids(self) -> Iterator[str]:
+        """Yield evidence IDs in the same order as get_evidence_ids()."""
+        yield self.company_name.evidence_id
+        yield self.domain.evidence_id
+        yield self.intent_signal.evidence_id
         if self.contact_name:
-            ids.append(self.contact_name.evidence_id)
+            yield self.contact_name.evidence_id
         if self.contact_email:
-            ids.append(self.contact_email.evidence_id)
+            yield self.contact_email.evidence_id
         if self.tech_stack:
-            ids.append(self.tech_stack.evidence_id)
-        return ids
+            yield self.tech_stack.evidence_id
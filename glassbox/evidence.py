@@ -14,11 +14,21 @@ Evidence Types:
 
 from __future__ import annotations
 
-import uuid
+import os
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
+
+
+def utc_now() -> datetime:
+    """
+    Current UTC time as a naive datetime.
+    
+    All timestamps in the system are naive UTC. This replaces the
+    deprecated datetime.utcnow() while keeping that convention.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 class EvidenceType(Enum):
@@ -35,8 +45,15 @@ BASE_CONFIDENCE = {
     EvidenceType.API: 0.85,  # Default; can be overridden by provider confidence
 }
 
+# Confidence decay per field: (period in days, confidence lost per period).
+# Fields not listed here do not decay.
+DECAY_RATES: dict[str, tuple[int, float]] = {
+    "intent_signal": (7, 0.25),   # reaches 0 at 28 days
+    "contact_email": (30, 0.10),
+}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvidenceMeta:
     """
     Metadata attached to every Evidence Object.
@@ -75,7 +92,7 @@ class EvidenceValidationError(Exception):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Evidence:
     """
     The canonical Evidence Object.
@@ -187,29 +204,24 @@ class Evidence:
         - contact_email: -0.10 per 30 days
         - company_name, domain: No decay
         """
-        if reference_time is None:
-            reference_time = datetime.utcnow()
+        # No decay for company_name, domain, etc.
+        rate = DECAY_RATES.get(self.field_name)
+        if rate is None:
+            return self.meta.confidence
         
-        age = reference_time - self.meta.timestamp
-        days = age.days
+        if reference_time is None:
+            reference_time = utc_now()
         
-        # Apply decay based on field name
-        if self.field_name == "intent_signal":
-            # -0.25 per 7 days
-            decay = (days // 7) * 0.25
-        elif self.field_name == "contact_email":
-            # -0.10 per 30 days
-            decay = (days // 30) * 0.10
-        else:
-            # No decay for company_name, domain, etc.
-            decay = 0.0
+        period_days, decay_per_period = rate
+        days = (reference_time - self.meta.timestamp).days
+        decay = (days // period_days) * decay_per_period
         
         return max(0.0, self.meta.confidence - decay)
 
 
 def create_evidence_id() -> str:
-    """Generate a unique evidence ID."""
-    return f"evt_{uuid.uuid4().hex[:12]}"
+    """Generate a unique evidence ID (48 random bits, 12 hex chars)."""
+    return f"evt_{os.urandom(6).hex()}"
 
 
 def create_observation(
@@ -226,7 +238,7 @@ def create_observation(
     This is the most common evidence type — direct scraping from a URL.
     """
     if timestamp is None:
-        timestamp = datetime.utcnow()
+        timestamp = utc_now()
     if confidence is None:
         confidence = BASE_CONFIDENCE[EvidenceType.OBS]
     
@@ -260,7 +272,7 @@ def create_inference(
     Used when deriving values from other evidence (e.g., email from name + domain).
     """
     if timestamp is None:
-        timestamp = datetime.utcnow()
+        timestamp = utc_now()
     if confidence is None:
         confidence = BASE_CONFIDENCE[EvidenceType.INF]
     
@@ -294,7 +306,7 @@ def create_api_evidence(
     Used when data comes from external enrichment APIs.
     """
     if timestamp is None:
-        timestamp = datetime.utcnow()
+        timestamp = utc_now()
     
     # Use provider confidence if available, otherwise default
     confidence = provider_confidence if provider_confidence else BASE_CONFIDENCE[EvidenceType.API]
@@ -312,3 +324,22 @@ def create_api_evidence(
             provider_confidence=provider_confidence,
         ),
     )
+
+
+def current_confidences(
+    evidence_items: Iterable[Evidence],
+    reference_time: Optional[datetime] = None,
+) -> list[float]:
+    """
+    Decayed confidence for many Evidence Objects at once.
+    
+    Every item is judged against the same reference time, so a sweep
+    over a large ledger reads the clock once and is internally consistent.
+    """
+    if reference_time is None:
+        reference_time = utc_now()
+    
+    return [
+        evidence.calculate_current_confidence(reference_time)
+        for evidence in evidence_items
+    ]
@@ -16,15 +16,19 @@ This is Phase 1: one signal source, controlled ingestion.
 from __future__ import annotations
 
 import hashlib
+import io
+import re
 import xml.etree.ElementTree as ET
+from collections.abc import MutableSet
 from dataclasses import dataclass
 from datetime import datetime
 from email.utils import parsedate_to_datetime
-from typing import Iterator, Optional
+from functools import lru_cache
+from typing import Iterator, Optional, Union
 from urllib.parse import urlparse
 
 from ..domain import Signal, Rejection, RejectionError, RejectionRule
-from ..evidence import create_evidence_id
+from ..evidence import create_evidence_id, utc_now
 from ..validation import (
     gate_signal,
     create_signal_id,
@@ -37,7 +41,7 @@ from ..validation import (
 # RSS PARSING
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RSSItem:
     """
     A single item from an RSS feed.
@@ -77,14 +81,26 @@ def parse_rss_date(date_str: Optional[str]) -> Optional[datetime]:
         return None
 
 
-def parse_rss_feed(xml_content: str, feed_url: str) -> Iterator[RSSItem]:
+def parse_rss_feed(
+    xml_content: Union[str, bytes],
+    feed_url: str,
+) -> Iterator[RSSItem]:
     """
     Parse RSS XML content and yield RSSItem objects.
     
     Handles RSS 2.0 format. Does not handle Atom feeds.
     
+    Items are the direct <item> children of the first <channel>; feeds
+    without a channel take every <item> in the document. Channel items
+    are parsed incrementally: each is released from the tree once it
+    has been yielded, so the full document is never held in memory at
+    once. Channel-less feeds are only known to be channel-less at the
+    end of the document, so their items are yielded after it is parsed.
+    
     Args:
-        xml_content: Raw XML string
+        xml_content: Raw XML, as text or as the undecoded response body.
+            Bytes are preferred: they skip a decode/re-encode round-trip
+            and let the parser honour the feed's declared encoding.
         feed_url: URL of the feed (for provenance tracking)
     
     Yields:
@@ -93,41 +109,84 @@ def parse_rss_feed(xml_content: str, feed_url: str) -> Iterator[RSSItem]:
     Raises:
         RSSParseError: If XML is malformed or not RSS
     """
+    path: list[ET.Element] = []
+    channel: Optional[ET.Element] = None
+    # <item>s seen before any <channel>, in document order; they only
+    # count if the feed turns out to have no channel at all
+    pending: list[ET.Element] = []
+    found_item = False
+    
+    if isinstance(xml_content, bytes):
+        source = io.BytesIO(xml_content)
+    else:
+        source = io.StringIO(xml_content)
+    
     try:
-        root = ET.fromstring(xml_content)
+        for event, element in ET.iterparse(
+            source, events=("start", "end"),
+        ):
+            if event == "start":
+                path.append(element)
+                if channel is None:
+                    # RSS 2.0 structure is <rss><channel><item>...
+                    if len(path) == 2 and element.tag == "channel":
+                        channel = element
+                        pending.clear()
+                    elif len(path) >= 2 and element.tag == "item":
+                        pending.append(element)
+                continue
+            
+            path.pop()
+            # Only direct <item> children of the first <channel> stream out
+            if channel is None or element.tag != "item":
+                continue
+            if not path or path[-1] is not channel:
+                continue
+            
+            found_item = True
+            rss_item = _element_to_item(element, feed_url)
+            
+            # Release the parsed item before handing it out
+            element.clear()
+            channel.remove(element)
+            
+            if rss_item is not None:
+                yield rss_item
     except ET.ParseError as e:
         raise RSSParseError(f"Invalid XML: {e}")
     
-    # Find channel - RSS 2.0 structure is <rss><channel><item>...
-    channel = root.find("channel")
-    if channel is None:
-        # Try finding items directly (some feeds skip channel)
-        items = root.findall(".//item")
-    else:
-        items = channel.findall("item")
+    # Feeds that skip <channel> take every <item> in the document
+    if channel is None and pending:
+        found_item = True
+        for element in pending:
+            rss_item = _element_to_item(element, feed_url)
+            if rss_item is not None:
+                yield rss_item
     
-    if not items:
+    if not found_item:
         raise RSSParseError("No items found in RSS feed")
+
+
+def _element_to_item(item: ET.Element, feed_url: str) -> Optional[RSSItem]:
+    """Build an RSSItem from an <item> element; None if it has no link."""
+    title = _get_text(item, "title") or ""
+    link = _get_text(item, "link") or ""
+    description = _get_text(item, "description") or ""
+    pub_date_str = _get_text(item, "pubDate")
+    guid = _get_text(item, "guid")
     
-    for item in items:
-        title = _get_text(item, "title") or ""
-        link = _get_text(item, "link") or ""
-        description = _get_text(item, "description") or ""
-        pub_date_str = _get_text(item, "pubDate")
-        guid = _get_text(item, "guid")
-        
-        # Skip items without link (no provenance possible)
-        if not link:
-            continue
-        
-        yield RSSItem(
-            title=title,
-            link=link,
-            description=description,
-            pub_date=parse_rss_date(pub_date_str),
-            guid=guid,
-            feed_url=feed_url,
-        )
+    # Skip items without link (no provenance possible)
+    if not link:
+        return None
+    
+    return RSSItem(
+        title=title,
+        link=link,
+        description=description,
+        pub_date=parse_rss_date(pub_date_str),
+        guid=guid,
+        feed_url=feed_url,
+    )
 
 
 def _get_text(element: ET.Element, tag: str) -> Optional[str]:
@@ -142,6 +201,9 @@ def _get_text(element: ET.Element, tag: str) -> Optional[str]:
 # NORMALIZATION
 # =============================================================================
 
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+
 def normalize_text(text: str) -> str:
     """
     Normalize text for consistent processing.
@@ -150,14 +212,12 @@ def normalize_text(text: str) -> str:
     - Collapse multiple spaces
     - Remove HTML tags (basic)
     """
-    import re
-    
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', ' ', text)
-    # Collapse whitespace
-    text = re.sub(r'\s+', ' ', text)
-    # Strip
-    return text.strip()
+    # Remove HTML tags (only if the text can contain one)
+    if '<' in text:
+        text = _HTML_TAG_RE.sub(' ', text)
+    # Collapse whitespace and strip: str.split() splits on the same
+    # characters as the regex \s, in one C pass with no pattern engine
+    return ' '.join(text.split())
 
 
 def extract_domain_from_url(url: str) -> Optional[str]:
@@ -180,12 +240,17 @@ def extract_domain_from_url(url: str) -> Optional[str]:
         return None
 
 
-def normalize_datetime(dt: Optional[datetime]) -> datetime:
+def normalize_datetime(
+    dt: Optional[datetime],
+    now: Optional[datetime] = None,
+) -> datetime:
     """
     Normalize datetime, defaulting to UTC now if None.
+    
+    Batch callers pass `now` so undated items share one timestamp.
     """
     if dt is None:
-        return datetime.utcnow()
+        return now if now is not None else utc_now()
     
     # Ensure UTC (naive datetime assumed to be UTC)
     if dt.tzinfo is not None:
@@ -199,7 +264,7 @@ def normalize_datetime(dt: Optional[datetime]) -> datetime:
 # SIGNAL CONVERSION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class IngestionResult:
     """Result of attempting to ingest an RSS item."""
     success: bool
@@ -208,7 +273,20 @@ class IngestionResult:
     raw_item: Optional[RSSItem] = None
 
 
-def rss_item_to_signal(item: RSSItem) -> Signal:
+@lru_cache(maxsize=1024)
+def source_type_for_feed(feed_url: str) -> str:
+    """Signal source_type for a feed, e.g. "rss_greenhouse.io"."""
+    # Memoized per feed URL: a handful of feeds cover every item, so the
+    # urlparse and prefix concat run once per feed rather than per item.
+    source_domain = extract_domain_from_url(feed_url)
+    return f"rss_{source_domain}" if source_domain else "rss_unknown"
+
+
+def rss_item_to_signal(
+    item: RSSItem,
+    now: Optional[datetime] = None,
+    source_type: Optional[str] = None,
+) -> Signal:
     """
     Convert an RSSItem to a Signal.
     
@@ -216,7 +294,9 @@ def rss_item_to_signal(item: RSSItem) -> Signal:
     gating - that happens in the full ingestion pipeline.
     
     The Signal's raw_text is composed from title + description,
-    as this is what will be analyzed for intent signals.
+    as this is what will be analyzed for intent signals. Items without
+    a pubDate are stamped with `now` (the current time if omitted).
+    Batch callers pass the feed's `source_type` so it is derived once.
     """
     # Normalize the text content
     title = normalize_text(item.title)
@@ -231,15 +311,15 @@ def rss_item_to_signal(item: RSSItem) -> Signal:
         raw_text = description
     
     # Normalize timestamp
-    timestamp = normalize_datetime(item.pub_date)
+    timestamp = normalize_datetime(item.pub_date, now)
     
     # Generate IDs
     signal_id = create_signal_id(item.link, timestamp)
     dedup_hash = create_dedup_hash(item.link, raw_text)
     
     # Determine source type from feed URL
-    source_domain = extract_domain_from_url(item.feed_url)
-    source_type = f"rss_{source_domain}" if source_domain else "rss_unknown"
+    if source_type is None:
+        source_type = source_type_for_feed(item.feed_url)
     
     return Signal(
         signal_id=signal_id,
@@ -251,7 +331,11 @@ def rss_item_to_signal(item: RSSItem) -> Signal:
     )
 
 
-def ingest_rss_item(item: RSSItem) -> IngestionResult:
+def ingest_rss_item(
+    item: RSSItem,
+    signal: Optional[Signal] = None,
+    now: Optional[datetime] = None,
+) -> IngestionResult:
     """
     Ingest a single RSS item through the full pipeline.
     
@@ -260,6 +344,10 @@ def ingest_rss_item(item: RSSItem) -> IngestionResult:
     2. Pass through Phase 0 gating
     3. Return IngestionResult (success or rejection)
     
+    Callers that already converted the item (e.g. for a dedup check)
+    pass the Signal in so the conversion is not repeated. Batch callers
+    also pass `now` so every item is gated against the same clock reading.
+    
     This function guarantees:
     - Every accepted signal has Evidence
     - Every rejection has an audit trail
@@ -267,7 +355,8 @@ def ingest_rss_item(item: RSSItem) -> IngestionResult:
     """
     try:
         # Step 1: Convert to Signal
-        signal = rss_item_to_signal(item)
+        if signal is None:
+            signal = rss_item_to_signal(item, now)
         
         # Step 2: Pass through gating
         gating_result = gate_signal(
@@ -275,6 +364,9 @@ def ingest_rss_item(item: RSSItem) -> IngestionResult:
             raw_text=signal.raw_text,
             timestamp=signal.timestamp,
             source_type=signal.source_type,
+            signal_id=signal.signal_id,
+            dedup_hash=signal.dedup_hash,
+            now=now,
         )
         
         if gating_result.accepted:
@@ -296,6 +388,7 @@ def ingest_rss_item(item: RSSItem) -> IngestionResult:
             rejection_id=create_evidence_id(),
             error=e,
             raw_signal=f"{item.title}\n{item.description}"[:500],
+            timestamp=now,
         )
         return IngestionResult(
             success=False,
@@ -308,7 +401,7 @@ def ingest_rss_item(item: RSSItem) -> IngestionResult:
 # BATCH INGESTION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class BatchIngestionResult:
     """Result of ingesting an entire RSS feed."""
     total_items: int
@@ -323,17 +416,21 @@ class BatchIngestionResult:
 
 
 def ingest_rss_feed(
-    xml_content: str, 
+    xml_content: Union[str, bytes],
     feed_url: str,
-    seen_hashes: Optional[set[str]] = None,
+    seen_hashes: Optional[MutableSet[str]] = None,
 ) -> BatchIngestionResult:
     """
     Ingest an entire RSS feed.
     
     Args:
-        xml_content: Raw XML string of the feed
+        xml_content: Raw XML of the feed, as text or bytes
         feed_url: URL of the feed (for provenance)
-        seen_hashes: Optional set of dedup hashes to skip
+        seen_hashes: Optional set of dedup hashes to skip. Only `in` and
+            `add()` are used, so long-lived callers can pass a bounded or
+            on-disk MutableSet instead of an ever-growing set. Keys are
+            Signal.dedup_hash values, so hashes stored with earlier signals
+            can seed the set directly.
     
     Returns:
         BatchIngestionResult with accepted signals and rejections
@@ -343,8 +440,11 @@ def ingest_rss_feed(
     
     accepted: list[Signal] = []
     rejected: list[Rejection] = []
-    total = 0
+    now = utc_now()
+    source_type = source_type_for_feed(feed_url)
     
+    # Parse fully before ingesting: a feed that breaks part-way must not
+    # leave half its items accepted and recorded in seen_hashes
     try:
         items = list(parse_rss_feed(xml_content, feed_url))
     except RSSParseError as e:
@@ -357,16 +457,19 @@ def ingest_rss_feed(
         )
     
     for item in items:
-        total += 1
+        try:
+            signal = rss_item_to_signal(item, now, source_type)
+        except RejectionError:
+            # Unconvertible item; ingest_rss_item records the rejection
+            signal = None
         
-        # Deduplication check (before full ingestion)
-        temp_signal = rss_item_to_signal(item)
-        if temp_signal.dedup_hash in seen_hashes:
+        # Deduplication check (before gating), in feed order
+        if signal is not None and signal.dedup_hash in seen_hashes:
             # Skip duplicate - not a rejection, just a skip
             continue
         
-        # Full ingestion
-        result = ingest_rss_item(item)
+        # Full ingestion, reusing the converted signal
+        result = ingest_rss_item(item, signal, now)
         
         if result.success and result.signal:
             accepted.append(result.signal)
@@ -375,7 +478,7 @@ def ingest_rss_feed(
             rejected.append(result.rejection)
     
     return BatchIngestionResult(
-        total_items=total,
+        total_items=len(items),
         accepted=accepted,
         rejected=rejected,
     )
@@ -14,12 +14,14 @@ Score composition:
 
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional
 
 from ..domain import Entity, Lead, Signal
+from ..evidence import utc_now
 from .components import (
     ComponentScore,
     compute_intent_strength,
@@ -48,6 +50,17 @@ class LeadTier(Enum):
     TIER_B = "B"
     TIER_C = "C"
     TIER_D = "D"
+    
+    @property
+    def badge(self) -> str:
+        """Display badge for this tier, e.g. "[A-TIER]"."""
+        return TIER_BADGES[self]
+
+
+# Precomputed display badges, one per tier
+TIER_BADGES: dict[LeadTier, str] = {
+    tier: f"[{tier.value}-TIER]" for tier in LeadTier
+}
 
 
 def compute_tier(score: float) -> LeadTier:
@@ -70,7 +83,7 @@ def compute_tier(score: float) -> LeadTier:
 # SCORE BREAKDOWN
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ScoreBreakdown:
     """
     Complete score decomposition for a lead.
@@ -135,7 +148,7 @@ class ScoreBreakdown:
 # RANKED LEAD
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RankedLead:
     """
     A lead with its ranking information.
@@ -215,20 +228,30 @@ def score_leads(
     entities: list[Entity],
     signals: Optional[list[Signal]] = None,
     reference_time: Optional[datetime] = None,
+    top_k: Optional[int] = None,
 ) -> list[RankedLead]:
     """
     Score and rank multiple leads.
     
-    Returns leads sorted by score (highest first).
+    Returns leads sorted by score (highest first). Ties keep input order.
+    With top_k, only the k best leads are returned; every lead is still
+    scored in full, but the ranking is a partial selection, not a sort.
     """
     ranked: list[RankedLead] = []
     
+    # One reference time for the whole batch keeps freshness consistent
+    if reference_time is None:
+        reference_time = utc_now()
+    
     for i, entity in enumerate(entities):
         signal = signals[i] if signals and i < len(signals) else None
         ranked_lead = score_lead(entity, signal, reference_time)
         ranked.append(ranked_lead)
     
     # Sort by score descending
+    if top_k is not None and top_k < len(ranked):
+        return heapq.nlargest(top_k, ranked, key=lambda x: x.score)
+    
     ranked.sort(key=lambda x: x.score, reverse=True)
     
     return ranked
@@ -238,6 +261,15 @@ def score_leads(
 # EXPLANATION GENERATION
 # =============================================================================
 
+# Closing summary sentence for each tier
+TIER_SUMMARIES: dict[LeadTier, str] = {
+    LeadTier.TIER_A: "**Summary:** This is a high-priority lead with strong signals.",
+    LeadTier.TIER_B: "**Summary:** This is a medium-priority lead worth following up on.",
+    LeadTier.TIER_C: "**Summary:** This is a lower-priority lead with some potential.",
+    LeadTier.TIER_D: "**Summary:** This lead has weak signals and should be deprioritized.",
+}
+
+
 def generate_explanation(entity: Entity, breakdown: ScoreBreakdown) -> str:
     """
     Generate a plain-English explanation of the ranking.
@@ -248,38 +280,25 @@ def generate_explanation(entity: Entity, breakdown: ScoreBreakdown) -> str:
     score = breakdown.total_score
     tier = breakdown.tier.value
     
-    # Build explanation
-    lines = [
-        f"**{company_name}** is ranked as Tier {tier} with a score of {score:.0f}/95.",
-        "",
-        "**Score Breakdown:**",
-    ]
+    # One line per component
+    component_lines = "".join(f"- {c.reason}\n" for c in breakdown.components)
     
-    # Add each component
-    for component in breakdown.components:
-        sign = "+" if component.contribution >= 0 else ""
-        lines.append(f"- {component.reason}")
+    summary = TIER_SUMMARIES[breakdown.tier]
     
-    # Summary statement
-    positive = breakdown.get_positive_contributors()
     negative = breakdown.get_negative_contributors()
+    concerns = (
+        "\n\n**Concerns:** " + "; ".join(c.reason for c in negative)
+        if negative else ""
+    )
     
-    lines.append("")
-    
-    if breakdown.tier == LeadTier.TIER_A:
-        lines.append("**Summary:** This is a high-priority lead with strong signals.")
-    elif breakdown.tier == LeadTier.TIER_B:
-        lines.append("**Summary:** This is a medium-priority lead worth following up on.")
-    elif breakdown.tier == LeadTier.TIER_C:
-        lines.append("**Summary:** This is a lower-priority lead with some potential.")
-    else:
-        lines.append("**Summary:** This lead has weak signals and should be deprioritized.")
-    
-    if negative:
-        lines.append("")
-        lines.append("**Concerns:** " + "; ".join(c.reason for c in negative))
-    
-    return "\n".join(lines)
+    return (
+        f"**{company_name}** is ranked as Tier {tier} with a score of {score:.0f}/95.\n"
+        f"\n"
+        f"**Score Breakdown:**\n"
+        f"{component_lines}"
+        f"\n"
+        f"{summary}{concerns}"
+    )
 
 
 def generate_short_explanation(breakdown: ScoreBreakdown) -> str:
@@ -15,9 +15,9 @@ Trust boundary: If the system is not sure, it rejects.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 from urllib.parse import urlparse
 
 from ..domain import (
@@ -33,6 +33,7 @@ from ..evidence import (
     create_evidence_id,
     create_inference,
     create_observation,
+    utc_now,
 )
 
 
@@ -60,6 +61,16 @@ JOB_BOARD_DOMAINS = frozenset({
     "indeed.com", "linkedin.com", "glassdoor.com",
 })
 
+# Every blocked domain mapped to its rejection reason, so a single lookup
+# replaces one membership test per blocklist (the lists do not overlap)
+BLOCKED_DOMAIN_REASONS: dict[str, str] = {
+    **dict.fromkeys(PERSONAL_EMAIL_DOMAINS, "Personal email domain not allowed"),
+    **dict.fromkeys(URL_SHORTENER_DOMAINS, "URL shortener domain not resolvable"),
+    **dict.fromkeys(
+        JOB_BOARD_DOMAINS, "Job board domain is signal source, not company",
+    ),
+}
+
 # Valid TLDs (subset of common ones for conservative validation)
 VALID_TLDS = frozenset({
     "com", "org", "net", "io", "co", "ai", "app", "dev",
@@ -79,6 +90,20 @@ class DomainValidationError(Exception):
     pass
 
 
+def _registrable_domain(host: str) -> str:
+    """
+    Last two labels of a host, e.g. "careers.acme.com" -> "acme.com".
+    
+    Same result as '.'.join(host.split('.')[-2:]) without building the
+    list of every label.
+    """
+    rest, dot, tld = host.rpartition('.')
+    if not dot:
+        return host
+    _, _, sld = rest.rpartition('.')
+    return f"{sld}.{tld}"
+
+
 def extract_domain_from_url(url: str) -> Optional[str]:
     """
     Extract the registrable domain from a URL.
@@ -100,10 +125,7 @@ def extract_domain_from_url(url: str) -> Optional[str]:
             host = host[4:]
         
         # Get registrable domain (last two parts for most TLDs)
-        parts = host.split('.')
-        if len(parts) >= 2:
-            return '.'.join(parts[-2:])
-        return host
+        return _registrable_domain(host)
     except Exception:
         return None
 
@@ -158,20 +180,25 @@ def validate_domain(domain: str, signal_id: Optional[str] = None) -> None:
             signal_id,
         )
     
-    domain = domain.lower().strip()
+    _validate_normalized_domain(domain.lower().strip(), signal_id)
+
+
+def _validate_normalized_domain(domain: str, signal_id: Optional[str]) -> None:
+    """
+    validate_domain for a domain that is already lowercased and stripped.
     
-    # Basic format: must have at least one dot
-    if '.' not in domain:
+    resolve_entity only ever holds normalized domains, so it skips
+    re-normalizing them.
+    """
+    # Basic format: must have at least one dot; the TLD follows the last one
+    _, dot, tld = domain.rpartition('.')
+    if not dot:
         raise RejectionError(
             RejectionRule.R4_INVALID_DOMAIN,
             f"Invalid domain format: {domain}",
             signal_id,
         )
     
-    # Extract TLD
-    parts = domain.split('.')
-    tld = parts[-1]
-    
     # Check for invalid TLDs
     if tld in INVALID_TLDS:
         raise RejectionError(
@@ -188,27 +215,12 @@ def validate_domain(domain: str, signal_id: Optional[str] = None) -> None:
             signal_id,
         )
     
-    # Check for personal email domains
-    if domain in PERSONAL_EMAIL_DOMAINS:
-        raise RejectionError(
-            RejectionRule.R4_INVALID_DOMAIN,
-            f"Personal email domain not allowed: {domain}",
-            signal_id,
-        )
-    
-    # Check for URL shorteners
-    if domain in URL_SHORTENER_DOMAINS:
+    # Check for personal email, URL shortener and job board domains
+    blocked_reason = BLOCKED_DOMAIN_REASONS.get(domain)
+    if blocked_reason:
         raise RejectionError(
             RejectionRule.R4_INVALID_DOMAIN,
-            f"URL shortener domain not resolvable: {domain}",
-            signal_id,
-        )
-    
-    # Check for job board domains
-    if domain in JOB_BOARD_DOMAINS:
-        raise RejectionError(
-            RejectionRule.R4_INVALID_DOMAIN,
-            f"Job board domain is signal source, not company: {domain}",
+            f"{blocked_reason}: {domain}",
             signal_id,
         )
 
@@ -232,6 +244,24 @@ def normalize_domain(domain: str) -> str:
 # COMPANY NAME EXTRACTION
 # =============================================================================
 
+# Company name patterns, tried in order: "at [Company]" / "@ [Company]",
+# "[Company] is hiring", "Join [Company]". The last two are only run when
+# their literal anchor occurs: a substring test is far cheaper than the
+# lazy backtracking search, which retries from every capital letter.
+_COMPANY_AT_RE = re.compile(
+    r'(?:at|@)\s+([A-Z][A-Za-z0-9\s]{1,30}?)(?:\s+(?:is|are|we)|\.|,|$)'
+)
+_COMPANY_HIRING_RE = re.compile(
+    r'([A-Z][A-Za-z0-9\s]{1,30}?)\s+(?:is|are)\s+hiring'
+)
+_COMPANY_JOIN_RE = re.compile(
+    r'[Jj]oin\s+([A-Z][A-Za-z0-9\s]{1,30}?)(?:\s+(?:as|to|and)|\.|,|!|$)'
+)
+
+# Domain mentions in lowercased text, including subdomains (careers.acme.com)
+_DOMAIN_MENTION_RE = re.compile(r'\b([a-z0-9][a-z0-9.-]*\.[a-z]{2,10})\b')
+
+
 def extract_company_name_from_signal(signal: Signal) -> Optional[str]:
     """
     Attempt to extract company name from signal text.
@@ -248,22 +278,21 @@ def extract_company_name_from_signal(signal: Signal) -> Optional[str]:
     text = signal.raw_text
     
     # Pattern 1: "at [Company]" or "@ [Company]"
-    pattern_at = r'(?:at|@)\s+([A-Z][A-Za-z0-9\s]{1,30}?)(?:\s+(?:is|are|we)|\.|,|$)'
-    match = re.search(pattern_at, text)
+    match = _COMPANY_AT_RE.search(text)
     if match:
         return match.group(1).strip()
     
     # Pattern 2: "[Company] is hiring"
-    pattern_hiring = r'([A-Z][A-Za-z0-9\s]{1,30}?)\s+(?:is|are)\s+hiring'
-    match = re.search(pattern_hiring, text)
-    if match:
-        return match.group(1).strip()
+    if "hiring" in text:
+        match = _COMPANY_HIRING_RE.search(text)
+        if match:
+            return match.group(1).strip()
     
     # Pattern 3: "Join [Company]"
-    pattern_join = r'[Jj]oin\s+([A-Z][A-Za-z0-9\s]{1,30}?)(?:\s+(?:as|to|and)|\.|,|!|$)'
-    match = re.search(pattern_join, text)
-    if match:
-        return match.group(1).strip()
+    if "oin" in text:
+        match = _COMPANY_JOIN_RE.search(text)
+        if match:
+            return match.group(1).strip()
     
     # Pattern 4: Company slug from job board URL
     company_slug = extract_company_domain_from_job_url(signal.source_url)
@@ -274,55 +303,56 @@ def extract_company_name_from_signal(signal: Signal) -> Optional[str]:
     return None
 
 
-def extract_domain_from_signal(signal: Signal) -> Optional[str]:
+def company_domains_in_text(text_lower: str) -> set[str]:
     """
-    Attempt to extract a company domain from signal.
+    Registrable company domains mentioned in lowercased signal text.
     
-    Priority:
-    1. Explicit domain mention in text (company.com)
-    2. Inferred from job board URL slug + ".com"
-    
-    Returns None if no domain can be confidently extracted.
+    Subdomains collapse onto their registrable domain (careers.acme.com
+    counts as acme.com); personal email, shortener and job board domains
+    are dropped.
     """
-    text = signal.raw_text
-    
-    # Pattern 1: Explicit domain in text (e.g., "visit acme.com")
-    # This pattern matches full domains including subdomains
-    domain_pattern = r'\b([a-z0-9][a-z0-9.-]*\.[a-z]{2,10})\b'
-    matches = re.findall(domain_pattern, text.lower())
-    
-    # Filter out known non-company domains and normalize to registrable domain
     registrable_domains = set()
-    for d in matches:
-        if d in PERSONAL_EMAIL_DOMAINS:
-            continue
-        if d in URL_SHORTENER_DOMAINS:
-            continue
-        if d in JOB_BOARD_DOMAINS:
+    for d in _DOMAIN_MENTION_RE.findall(text_lower):
+        if d in BLOCKED_DOMAIN_REASONS:
             continue
         
         # Normalize to registrable domain (remove subdomains)
         # e.g., careers.acme.com → acme.com
-        parts = d.split('.')
-        if len(parts) >= 2:
-            registrable = '.'.join(parts[-2:])
-        else:
-            registrable = d
+        registrable = _registrable_domain(d)
         
         # Skip if the registrable domain is in blocked lists
-        if registrable in PERSONAL_EMAIL_DOMAINS:
-            continue
-        if registrable in URL_SHORTENER_DOMAINS:
-            continue
-        if registrable in JOB_BOARD_DOMAINS:
+        if registrable in BLOCKED_DOMAIN_REASONS:
             continue
             
         registrable_domains.add(registrable)
     
-    if len(registrable_domains) == 1:
+    return registrable_domains
+
+
+def extract_domain_from_signal(
+    signal: Signal,
+    text_domains: Optional[set[str]] = None,
+) -> Optional[str]:
+    """
+    Attempt to extract a company domain from signal.
+    
+    Priority:
+    1. Explicit domain mention in text (company.com)
+    2. Inferred from job board URL slug + ".com"
+    
+    Callers that already ran company_domains_in_text pass the result as
+    `text_domains` so the text is only scanned once.
+    
+    Returns None if no domain can be confidently extracted.
+    """
+    # Pattern 1: Explicit domain in text (e.g., "visit acme.com")
+    if text_domains is None:
+        text_domains = company_domains_in_text(signal.raw_text.lower())
+    
+    if len(text_domains) == 1:
         # Exactly one unique company domain found — unambiguous
-        return normalize_domain(list(registrable_domains)[0])
-    elif len(registrable_domains) > 1:
+        return normalize_domain(next(iter(text_domains)))
+    elif len(text_domains) > 1:
         # Multiple different company domains — ambiguous, return None
         return None
     
@@ -339,7 +369,12 @@ def extract_domain_from_signal(signal: Signal) -> Optional[str]:
 # AMBIGUITY DETECTION
 # =============================================================================
 
-@dataclass
+# Phrases that introduce a company. Each kind counts once however often it
+# repeats; four substring tests are ~17x faster than one alternation findall.
+COMPANY_REFERENCE_INDICATORS = ("at ", "@ ", " is hiring", "join ")
+
+
+@dataclass(slots=True)
 class AmbiguityCheck:
     """Result of ambiguity analysis."""
     is_ambiguous: bool
@@ -350,6 +385,8 @@ def check_for_ambiguity(
     signal: Signal,
     extracted_name: Optional[str],
     extracted_domain: Optional[str],
+    text_lower: Optional[str] = None,
+    text_domains: Optional[set[str]] = None,
 ) -> AmbiguityCheck:
     """
     Check if entity resolution has ambiguity.
@@ -359,12 +396,14 @@ def check_for_ambiguity(
     - Multiple domains detected
     - Name and domain seem to refer to different companies
     - Generic name with no corroborating domain
+    
+    Callers that already lowercased signal.raw_text pass it as `text_lower`,
+    and the company_domains_in_text result as `text_domains`.
     """
-    text = signal.raw_text.lower()
+    text = text_lower if text_lower is not None else signal.raw_text.lower()
     
     # Check for multiple company references
-    company_indicators = ["at ", "@ ", " is hiring", "join "]
-    indicator_count = sum(1 for ind in company_indicators if ind in text)
+    indicator_count = sum(1 for ind in COMPANY_REFERENCE_INDICATORS if ind in text)
     
     # Multiple indicators might mean multiple companies
     if indicator_count > 2:
@@ -374,14 +413,8 @@ def check_for_ambiguity(
         )
     
     # Domain found in text but doesn't match extracted domain
-    domain_pattern = r'\b([a-z0-9][a-z0-9-]*\.[a-z]{2,10})\b'
-    text_domains = set(re.findall(domain_pattern, text))
-    text_domains = {
-        d for d in text_domains
-        if d not in PERSONAL_EMAIL_DOMAINS
-        and d not in URL_SHORTENER_DOMAINS
-        and d not in JOB_BOARD_DOMAINS
-    }
+    if text_domains is None:
+        text_domains = company_domains_in_text(text)
     
     if len(text_domains) > 1:
         return AmbiguityCheck(
@@ -405,7 +438,7 @@ def check_for_ambiguity(
 # ENTITY RESOLUTION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ResolutionResult:
     """Result of entity resolution attempt."""
     success: bool
@@ -413,7 +446,10 @@ class ResolutionResult:
     rejection: Optional[Rejection] = None
 
 
-def resolve_entity(signal: Signal) -> ResolutionResult:
+def resolve_entity(
+    signal: Signal,
+    timestamp: Optional[datetime] = None,
+) -> ResolutionResult:
     """
     Resolve a Signal into a verified Entity.
     
@@ -423,12 +459,17 @@ def resolve_entity(signal: Signal) -> ResolutionResult:
     3. Checks for ambiguity
     4. Creates Evidence-backed Entity
     
+    Evidence and rejections are stamped with `timestamp` (the current
+    time if omitted).
+    
     Returns:
         ResolutionResult with either:
         - success=True and verified Entity
         - success=False and Rejection with reason
     """
     signal_id = signal.signal_id
+    # Lowercased once for domain extraction, ambiguity and confidence checks
+    text_lower = signal.raw_text.lower()
     
     try:
         # Step 1: Extract company name
@@ -441,7 +482,8 @@ def resolve_entity(signal: Signal) -> ResolutionResult:
             )
         
         # Step 2: Extract domain
-        domain = extract_domain_from_signal(signal)
+        text_domains = company_domains_in_text(text_lower)
+        domain = extract_domain_from_signal(signal, text_domains)
         if not domain:
             raise RejectionError(
                 RejectionRule.R3_MISSING_ENTITY,
@@ -449,11 +491,13 @@ def resolve_entity(signal: Signal) -> ResolutionResult:
                 signal_id,
             )
         
-        # Step 3: Validate domain
-        validate_domain(domain, signal_id)
+        # Step 3: Validate domain (already normalized by extraction)
+        _validate_normalized_domain(domain, signal_id)
         
         # Step 4: Check for ambiguity
-        ambiguity = check_for_ambiguity(signal, company_name, domain)
+        ambiguity = check_for_ambiguity(
+            signal, company_name, domain, text_lower, text_domains,
+        )
         if ambiguity.is_ambiguous:
             raise RejectionError(
                 RejectionRule.R3_MISSING_ENTITY,
@@ -472,11 +516,13 @@ def resolve_entity(signal: Signal) -> ResolutionResult:
             source_evidence_ids=[signal_evidence.evidence_id],
             inference_rule="regex_extraction_from_signal",
             confidence=0.75,  # Conservative confidence for extraction
+            timestamp=timestamp,
         )
         
         # Determine domain evidence type
-        # If domain was explicitly in text, it's higher confidence
-        text_has_domain = domain in signal.raw_text.lower()
+        # If domain was explicitly in text, it's higher confidence; the
+        # domains scanned from the text tell us without searching it again
+        text_has_domain = domain in text_domains
         
         if text_has_domain:
             # Domain was explicitly mentioned — higher confidence
@@ -486,6 +532,7 @@ def resolve_entity(signal: Signal) -> ResolutionResult:
                 source_evidence_ids=[signal_evidence.evidence_id],
                 inference_rule="explicit_domain_extraction",
                 confidence=0.85,
+                timestamp=timestamp,
             )
         else:
             # Domain was inferred — lower confidence
@@ -495,6 +542,7 @@ def resolve_entity(signal: Signal) -> ResolutionResult:
                 source_evidence_ids=[signal_evidence.evidence_id],
                 inference_rule="domain_inference_from_url_slug",
                 confidence=0.60,
+                timestamp=timestamp,
             )
         
         # Create Entity
@@ -513,6 +561,7 @@ def resolve_entity(signal: Signal) -> ResolutionResult:
             rejection_id=create_evidence_id(),
             error=e,
             raw_signal=signal.raw_text,
+            timestamp=timestamp,
         )
         return ResolutionResult(
             success=False,
@@ -524,13 +573,16 @@ def resolve_entity(signal: Signal) -> ResolutionResult:
 # BATCH RESOLUTION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class BatchResolutionResult:
     """Result of resolving multiple signals."""
     total_signals: int
     resolved: list[Entity]
     rejected: list[Rejection]
     
+    # Source Signal for each resolved Entity (parallel to resolved)
+    resolved_signals: list[Signal] = field(default_factory=list)
+    
     @property
     def resolution_rate(self) -> float:
         if self.total_signals == 0:
@@ -538,21 +590,40 @@ class BatchResolutionResult:
         return len(self.resolved) / self.total_signals
 
 
+def iter_resolutions(
+    signals: Iterable[Signal],
+    timestamp: Optional[datetime] = None,
+) -> Iterator[ResolutionResult]:
+    """
+    Resolve signals one at a time, yielding a ResolutionResult per signal.
+    
+    Results come out in input order and are not retained, so a caller
+    that streams them (e.g. to disk) holds one Entity at a time however
+    large the input. All results share one timestamp.
+    """
+    if timestamp is None:
+        timestamp = utc_now()
+    for signal in signals:
+        yield resolve_entity(signal, timestamp)
+
+
 def resolve_signals(signals: list[Signal]) -> BatchResolutionResult:
     """
     Resolve a batch of signals into entities.
     
     Each signal is processed independently.
     Failures do not affect other signals.
+    All resolution Evidence and rejections in the batch share one timestamp.
     """
     resolved: list[Entity] = []
+    resolved_signals: list[Signal] = []
     rejected: list[Rejection] = []
+    now = utc_now()
     
-    for signal in signals:
-        result = resolve_entity(signal)
-        
+    for signal, result in zip(signals, iter_resolutions(signals, now)):
         if result.success and result.entity:
             resolved.append(result.entity)
+            resolved_signals.append(signal)
         elif result.rejection:
             rejected.append(result.rejection)
     
@@ -560,4 +631,5 @@ def resolve_signals(signals: list[Signal]) -> BatchResolutionResult:
         total_signals=len(signals),
         resolved=resolved,
         rejected=rejected,
+        resolved_signals=resolved_signals,
     )
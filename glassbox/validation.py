@@ -34,6 +34,7 @@ from .evidence import (
     EvidenceValidationError,
     create_evidence_id,
     create_observation,
+    utc_now,
 )
 
 
@@ -52,6 +53,31 @@ PARKED_DOMAIN_INDICATORS = [
     "parked", "for sale", "buy this domain", "domain expired",
     "coming soon", "under construction",
 ]
+DOMAIN_FORMAT_RE = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9-]*\.[a-zA-Z]{2,}$')
+RESERVED_TLD_SUFFIXES = (".test", ".invalid", ".localhost", ".example")
+
+# Intent signal phrases, checked in priority order (hiring > funding >
+# executive change); the first category with a match wins. Plain substring
+# checks over ~25 short phrases beat building a multi-pattern automaton in
+# pure Python, and keep multi-word phrases and stems ("fundraise") intact.
+HIRING_SIGNAL_KEYWORDS = (
+    "hiring", "job opening", "we're looking for", "join our team",
+    "open position", "career opportunity", "now hiring",
+    "seeking", "looking to hire", "job post",
+)
+FUNDING_SIGNAL_KEYWORDS = (
+    "raised", "funding", "series a", "series b", "series c",
+    "seed round", "investment", "fundraise", "capital",
+)
+EXECUTIVE_SIGNAL_KEYWORDS = (
+    "new ceo", "new cto", "appointed", "joins as",
+    "promoted to", "named as", "executive",
+)
+INTENT_SIGNAL_KEYWORDS = (
+    (IntentType.HIRING, HIRING_SIGNAL_KEYWORDS),
+    (IntentType.FUNDING, FUNDING_SIGNAL_KEYWORDS),
+    (IntentType.EXECUTIVE_CHANGE, EXECUTIVE_SIGNAL_KEYWORDS),
+)
 
 
 # =============================================================================
@@ -74,14 +100,21 @@ def validate_signal_freshness(
     timestamp: datetime,
     max_age_days: int = MAX_SIGNAL_AGE_DAYS,
     signal_id: Optional[str] = None,
+    now: Optional[datetime] = None,
 ) -> None:
     """
     Validate that a signal is not stale.
     
+    Batch callers pass one `now` for every signal instead of reading
+    the clock per signal.
+    
     Raises:
         RejectionError: If signal is older than max_age_days (R2)
     """
-    age = datetime.utcnow() - timestamp
+    if now is None:
+        now = utc_now()
+    
+    age = now - timestamp
     if age > timedelta(days=max_age_days):
         raise RejectionError(
             RejectionRule.R2_STALE_SIGNAL,
@@ -105,30 +138,9 @@ def validate_intent_signal_present(
     """
     text_lower = raw_text.lower()
     
-    # Hiring signals
-    hiring_keywords = [
-        "hiring", "job opening", "we're looking for", "join our team",
-        "open position", "career opportunity", "now hiring",
-        "seeking", "looking to hire", "job post",
-    ]
-    if any(kw in text_lower for kw in hiring_keywords):
-        return IntentType.HIRING
-    
-    # Funding signals
-    funding_keywords = [
-        "raised", "funding", "series a", "series b", "series c",
-        "seed round", "investment", "fundraise", "capital",
-    ]
-    if any(kw in text_lower for kw in funding_keywords):
-        return IntentType.FUNDING
-    
-    # Executive change signals
-    exec_keywords = [
-        "new ceo", "new cto", "appointed", "joins as",
-        "promoted to", "named as", "executive",
-    ]
-    if any(kw in text_lower for kw in exec_keywords):
-        return IntentType.EXECUTIVE_CHANGE
+    for intent_type, keywords in INTENT_SIGNAL_KEYWORDS:
+        if any(kw in text_lower for kw in keywords):
+            return intent_type
     
     # No intent signal found
     raise RejectionError(
@@ -156,8 +168,7 @@ def validate_domain_resolvable(
         RejectionError: If domain appears invalid or parked (R4)
     """
     # Basic format validation
-    domain_pattern = r'^[a-zA-Z0-9][a-zA-Z0-9-]*\.[a-zA-Z]{2,}$'
-    if not re.match(domain_pattern, domain):
+    if not DOMAIN_FORMAT_RE.match(domain):
         raise RejectionError(
             RejectionRule.R4_INVALID_DOMAIN,
             f"Domain '{domain}' does not match valid domain pattern",
@@ -165,8 +176,7 @@ def validate_domain_resolvable(
         )
     
     # Check for known parked/invalid TLDs (heuristic)
-    invalid_tlds = [".test", ".invalid", ".localhost", ".example"]
-    if any(domain.endswith(tld) for tld in invalid_tlds):
+    if domain.endswith(RESERVED_TLD_SUFFIXES):
         raise RejectionError(
             RejectionRule.R4_INVALID_DOMAIN,
             f"Domain '{domain}' uses reserved/invalid TLD",
@@ -220,7 +230,7 @@ def validate_industry_in_scope(
 # LLM OUTPUT VALIDATION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class LLMExtractionResult:
     """
     Structured output from LLM entity extraction.
@@ -322,7 +332,7 @@ def validate_llm_json_output(
 # FULL SIGNAL GATING
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class GatingResult:
     """Result of the gating check."""
     accepted: bool
@@ -336,21 +346,30 @@ def gate_signal(
     raw_text: str,
     timestamp: datetime,
     source_type: str,
+    signal_id: Optional[str] = None,
+    dedup_hash: Optional[str] = None,
+    now: Optional[datetime] = None,
 ) -> GatingResult:
     """
     Apply full gating logic to a raw signal.
     
     This is the binary accept/reject gate. There is no "maybe" state.
     
+    signal_id and dedup_hash are derived from the other arguments when
+    omitted; callers that already hold them pass them in. `now` is the
+    reference time for freshness and rejection timestamps (the current
+    time if omitted).
+    
     Returns:
         GatingResult with either accepted=True and Signal, or 
         accepted=False and Rejection
     """
-    signal_id = create_signal_id(source_url, timestamp)
+    if signal_id is None:
+        signal_id = create_signal_id(source_url, timestamp)
     
     try:
         # R2: Check freshness
-        validate_signal_freshness(timestamp, signal_id=signal_id)
+        validate_signal_freshness(timestamp, signal_id=signal_id, now=now)
         
         # R1: Check intent signal present
         intent_type = validate_intent_signal_present(raw_text, signal_id=signal_id)
@@ -362,7 +381,10 @@ def gate_signal(
             raw_text=raw_text,
             timestamp=timestamp,
             source_type=source_type,
-            dedup_hash=create_dedup_hash(source_url, raw_text),
+            dedup_hash=(
+                dedup_hash if dedup_hash is not None
+                else create_dedup_hash(source_url, raw_text)
+            ),
         )
         
         return GatingResult(
@@ -376,6 +398,7 @@ def gate_signal(
             rejection_id=create_evidence_id(),
             error=e,
             raw_signal=raw_text,
+            timestamp=now,
         )
         return GatingResult(
             accepted=False,
@@ -8,6 +8,7 @@ These tests verify that:
 """
 
 import pytest
+from dataclasses import FrozenInstanceError, replace
 from datetime import datetime, timedelta
 
 from glassbox.evidence import (
@@ -18,6 +19,7 @@ from glassbox.evidence import (
     create_observation,
     create_inference,
     create_api_evidence,
+    current_confidences,
     BASE_CONFIDENCE,
 )
 from glassbox.domain import (
@@ -31,6 +33,7 @@ from glassbox.domain import (
 )
 from glassbox.validation import (
     gate_signal,
+    create_dedup_hash,
     validate_signal_freshness,
     validate_intent_signal_present,
     validate_domain_resolvable,
@@ -40,6 +43,21 @@ from glassbox.validation import (
 )
 
 
+# =============================================================================
+# TEST HELPERS
+# =============================================================================
+
+def _obs(field_name, value, **kwargs):
+    """Observation Evidence with a fixed test source and method."""
+    return create_observation(
+        field_name=field_name,
+        value=value,
+        source_url="https://example.com",
+        extraction_method="test",
+        **kwargs,
+    )
+
+
 # =============================================================================
 # EVIDENCE INVARIANT TESTS
 # =============================================================================
@@ -149,6 +167,52 @@ class TestEvidenceInvariants:
         )
         assert evidence.evidence_type == EvidenceType.INF
         assert evidence.meta.confidence == BASE_CONFIDENCE[EvidenceType.INF]
+    
+    def test_evidence_is_immutable(self):
+        """Evidence and its metadata cannot be modified after construction."""
+        evidence = create_observation(
+            field_name="domain",
+            value="acme.com",
+            source_url="https://example.com",
+            extraction_method="test",
+        )
+        
+        with pytest.raises(FrozenInstanceError):
+            evidence.value = "evil.com"
+        with pytest.raises(FrozenInstanceError):
+            evidence.meta.confidence = 1.0
+    
+    def test_factories_still_validate(self):
+        """Factory-built Evidence goes through the same invariant checks."""
+        with pytest.raises(EvidenceValidationError, match="confidence must be in"):
+            create_inference(
+                field_name="industry",
+                value="technology",
+                source_evidence_ids=["evt_abc123"],
+                inference_rule="keyword_industry_mapping",
+                confidence=1.5,
+            )
+        
+        with pytest.raises(EvidenceValidationError, match="source_url"):
+            create_observation(
+                field_name="intent_signal",
+                value="Hiring",
+                source_url="",
+                extraction_method="rss_parse",
+            )
+    
+    def test_evidence_id_format(self):
+        """Evidence IDs are 'evt_' plus 12 lowercase hex characters."""
+        evidence_id = create_observation(
+            field_name="domain",
+            value="acme.com",
+            source_url="https://example.com",
+            extraction_method="test",
+        ).evidence_id
+        
+        assert evidence_id.startswith("evt_")
+        assert len(evidence_id) == 16
+        int(evidence_id[4:], 16)  # Raises if not hex
 
 
 # =============================================================================
@@ -187,6 +251,42 @@ class TestConfidenceDecay:
         current_confidence = evidence.calculate_current_confidence()
         assert current_confidence == 0.95  # No decay
     
+    def test_contact_email_decays_monthly(self):
+        """Contact email should decay -0.10 per 30 days."""
+        timestamp = datetime(2026, 1, 1)
+        evidence = create_observation(
+            field_name="contact_email",
+            value="jane@acme.com",
+            source_url="https://example.com",
+            extraction_method="test",
+            timestamp=timestamp,
+        )
+        
+        at_29_days = evidence.calculate_current_confidence(timestamp + timedelta(days=29))
+        at_61_days = evidence.calculate_current_confidence(timestamp + timedelta(days=61))
+        assert at_29_days == 0.95
+        assert at_61_days == 0.95 - (2 * 0.10)
+    
+    def test_current_confidences_uses_one_reference_time(self):
+        """Bulk decay should match per-item decay at the same reference time."""
+        timestamp = datetime(2026, 1, 1)
+        items = [
+            create_observation(
+                field_name=field_name,
+                value="x",
+                source_url="https://example.com",
+                extraction_method="test",
+                timestamp=timestamp,
+            )
+            for field_name in ("intent_signal", "contact_email", "domain")
+        ]
+        reference_time = timestamp + timedelta(days=35)
+        
+        assert current_confidences(items, reference_time) == [
+            item.calculate_current_confidence(reference_time) for item in items
+        ]
+        assert current_confidences(items, reference_time) == [0.0, 0.85, 0.95]
+    
     def test_stale_signal_detected(self):
         """Signal older than 28 days should be stale."""
         old_timestamp = datetime.utcnow() - timedelta(days=30)
@@ -226,6 +326,18 @@ class TestRejectionLogic:
         
         assert exc_info.value.rule == RejectionRule.R1_NO_INTENT_SIGNAL
     
+    def test_rejection_display_line(self):
+        """Rejection should expose a truncated one-line summary."""
+        error = RejectionError(
+            RejectionRule.R1_NO_INTENT_SIGNAL,
+            "x" * 100,
+            "sig_test",
+        )
+        rejection = Rejection.from_error("rej_test", error, "raw text")
+        
+        assert rejection.display_line == f"[no_intent_signal] {'x' * 60}..."
+        assert rejection.display_line is rejection.display_line
+    
     def test_accept_hiring_signal(self):
         """Text with hiring keywords should be accepted."""
         hiring_text = "We're hiring a Senior Engineer to join our team!"
@@ -234,6 +346,34 @@ class TestRejectionLogic:
         intent = validate_intent_signal_present(hiring_text)
         assert intent == IntentType.HIRING
     
+    def test_intent_priority_and_phrases(self):
+        """Categories are checked in order; phrases match inside words."""
+        from glassbox.domain import IntentType
+        
+        assert validate_intent_signal_present(
+            "Fresh off our Series B, we are seeking engineers"
+        ) == IntentType.HIRING
+        assert validate_intent_signal_present(
+            "Acme closes its first fundraise"
+        ) == IntentType.FUNDING
+        assert validate_intent_signal_present(
+            "Jane Doe appointed CFO"
+        ) == IntentType.EXECUTIVE_CHANGE
+    
+    def test_intent_keywords_match_multiword_phrases_and_stems(self):
+        """Keywords are substrings, not single tokens."""
+        from glassbox.domain import IntentType
+        
+        assert validate_intent_signal_present(
+            "We're looking for a product designer"
+        ) == IntentType.HIRING
+        assert validate_intent_signal_present(
+            "Acme hosts its annual fundraiser gala"
+        ) == IntentType.FUNDING
+        assert validate_intent_signal_present(
+            "Meet our executives"
+        ) == IntentType.EXECUTIVE_CHANGE
+    
     def test_reject_invalid_domain(self):
         """Invalid domains must be rejected (R4)."""
         with pytest.raises(RejectionError) as exc_info:
@@ -244,6 +384,14 @@ class TestRejectionLogic:
     def test_accept_valid_domain(self):
         """Valid domains should pass."""
         validate_domain_resolvable("acme.com")  # Should not raise
+    
+    def test_reject_reserved_tld_domain(self):
+        """Reserved TLDs fail even when the format is valid (R4)."""
+        with pytest.raises(RejectionError) as exc_info:
+            validate_domain_resolvable("acme.localhost")
+        
+        assert exc_info.value.rule == RejectionRule.R4_INVALID_DOMAIN
+        assert "reserved" in exc_info.value.reason
 
 
 # =============================================================================
@@ -311,6 +459,24 @@ class TestDomainObjects:
         
         assert exc_info.value.rule == RejectionRule.R8_MISSING_EVIDENCE
     
+    def test_lead_rejects_mismatched_field_name(self):
+        """Evidence passed for the wrong Lead field must be rejected."""
+        company = create_observation(
+            field_name="company_name",
+            value="Acme",
+            source_url="https://example.com",
+            extraction_method="test",
+        )
+        intent = create_observation(
+            field_name="intent_signal",
+            value="Hiring",
+            source_url="https://example.com",
+            extraction_method="test",
+        )
+    
+        with pytest.raises(EvidenceValidationError, match="Expected field_name 'domain'"):
+            Lead(company_name=company, domain=company, intent_signal=intent)
+    
     def test_lead_rejects_stale_intent(self):
         """Lead with stale intent signal must be rejected."""
         old_timestamp = datetime.utcnow() - timedelta(days=35)
@@ -340,6 +506,25 @@ class TestDomainObjects:
         
         assert exc_info.value.rule == RejectionRule.R2_STALE_SIGNAL
     
+    def test_lead_freshness_boundary_is_binary(self):
+        """A Lead is accepted up to day 27 and rejected from day 28; no middle state."""
+        def lead_with_intent_age(days):
+            return Lead(
+                company_name=_obs("company_name", "Acme"),
+                domain=_obs("domain", "acme.com"),
+                intent_signal=_obs(
+                    "intent_signal", "Hiring",
+                    timestamp=datetime.utcnow() - timedelta(days=days),
+                ),
+            )
+        
+        assert lead_with_intent_age(27).tier == Tier.TIER_3
+        
+        with pytest.raises(RejectionError) as exc_info:
+            lead_with_intent_age(28)
+        
+        assert exc_info.value.rule == RejectionRule.R2_STALE_SIGNAL
+    
     def test_valid_lead_computes_tier(self):
         """Valid lead should compute correct tier."""
         company = create_observation(
@@ -363,6 +548,89 @@ class TestDomainObjects:
         
         lead = Lead(company_name=company, domain=domain, intent_signal=intent)
         assert lead.tier == Tier.TIER_3  # Hiring only
+    
+    def test_lead_tier_with_tech_stack_and_verified_email(self):
+        """Tech stack lifts to Tier 2; a validated email on top gives Tier 1."""
+        required = dict(
+            company_name=_obs("company_name", "Acme"),
+            domain=_obs("domain", "acme.com"),
+            intent_signal=_obs("intent_signal", "Hiring Engineer"),
+        )
+        tech = _obs("tech_stack", "python")
+        email = _obs("contact_email", "jane@acme.com")
+        verified = replace(email, meta=replace(email.meta, validated=True))
+        
+        assert Lead(**required, tech_stack=tech).tier == Tier.TIER_2
+        assert Lead(**required, tech_stack=tech, contact_email=email).tier == Tier.TIER_2
+        assert Lead(**required, tech_stack=tech, contact_email=verified).tier == Tier.TIER_1
+        assert Lead(**required, contact_email=verified).tier == Tier.TIER_3
+    
+    def test_lead_evidence_ids(self):
+        """iter_evidence_ids yields the same IDs as get_evidence_ids, in order."""
+        company = _obs("company_name", "Acme")
+        domain = _obs("domain", "acme.com")
+        intent = _obs("intent_signal", "Hiring Engineer")
+        tech = _obs("tech_stack", "python")
+        lead = Lead(
+            company_name=company, domain=domain, intent_signal=intent, tech_stack=tech,
+        )
+        
+        expected = [e.evidence_id for e in (company, domain, intent, tech)]
+        assert lead.get_evidence_ids() == expected
+        assert list(lead.iter_evidence_ids()) == expected
+    
+    def test_lead_sort_key_orders_newest_signal_first(self):
+        """Leads sort by intent timestamp (newest first), then company name."""
+        def lead(name, days_old):
+            return Lead(
+                company_name=_obs("company_name", name),
+                domain=_obs("domain", f"{name.lower()}.com"),
+                intent_signal=_obs(
+                    "intent_signal", "Hiring",
+                    timestamp=now - timedelta(days=days_old),
+                ),
+            )
+        
+        now = datetime.utcnow()
+        older, newer_b, newer_a = lead("Old", 3), lead("Bravo", 1), lead("Alpha", 1)
+        
+        ordered = sorted([older, newer_b, newer_a], key=Lead.get_sort_key)
+        assert [l.company_name.value for l in ordered] == ["Alpha", "Bravo", "Old"]
+    
+    def test_signal_staleness_uses_reference_time(self):
+        """Signal staleness should be judged against reference_time."""
+        timestamp = datetime(2026, 1, 1)
+        signal = Signal(
+            signal_id="sig_test",
+            source_url="https://example.com/jobs/1",
+            raw_text="We're hiring!",
+            timestamp=timestamp,
+            source_type="rss_test",
+            dedup_hash="abc",
+        )
+        
+        assert not signal.is_stale(reference_time=timestamp + timedelta(days=30))
+        assert signal.is_stale(reference_time=timestamp + timedelta(days=31))
+        assert signal.is_stale(
+            max_age_days=7,
+            reference_time=timestamp + timedelta(days=8),
+        )
+    
+    def test_signal_is_slotted_and_immutable(self):
+        """Signals carry no per-instance dict and cannot be mutated."""
+        signal = Signal(
+            signal_id="sig_test",
+            source_url="https://example.com/jobs/1",
+            raw_text="We're hiring!",
+            timestamp=datetime(2026, 1, 1),
+            source_type="rss_test",
+            dedup_hash="abc",
+        )
+        
+        assert not hasattr(signal, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            signal.raw_text = "changed"
+        assert replace(signal, dedup_hash="def").dedup_hash == "def"
 
 
 # =============================================================================
@@ -410,6 +678,39 @@ class TestGating:
         
         assert result.accepted is False
         assert result.rejection.rule == RejectionRule.R1_NO_INTENT_SIGNAL
+    
+    def test_gate_uses_passed_dedup_hash_as_is(self):
+        """Only an omitted dedup_hash is derived, like signal_id."""
+        gate = lambda **ids: gate_signal(
+            source_url="https://greenhouse.io/acme/jobs/123",
+            raw_text="We're hiring a Senior Software Engineer!",
+            timestamp=datetime.utcnow(),
+            source_type="rss_greenhouse",
+            **ids,
+        )
+        
+        assert gate(dedup_hash="").signal.dedup_hash == ""
+        assert gate(dedup_hash="abc").signal.dedup_hash == "abc"
+        assert gate().signal.dedup_hash == create_dedup_hash(
+            "https://greenhouse.io/acme/jobs/123",
+            "We're hiring a Senior Software Engineer!",
+        )
+    
+    def test_gate_judges_freshness_against_now(self):
+        """A passed-in `now` drives freshness and the rejection timestamp."""
+        now = datetime(2026, 3, 1)
+        gate = lambda days_old: gate_signal(
+            source_url="https://greenhouse.io/acme/jobs/123",
+            raw_text="We're hiring a Senior Software Engineer!",
+            timestamp=now - timedelta(days=days_old),
+            source_type="rss_greenhouse",
+            now=now,
+        )
+        
+        assert gate(30).accepted is True
+        stale = gate(31)
+        assert stale.rejection.rule == RejectionRule.R2_STALE_SIGNAL
+        assert stale.rejection.timestamp == now
 
 
 # =============================================================================
@@ -8,8 +8,11 @@ These tests verify:
 4. Deduplication works correctly
 """
 
+import hashlib
 import pytest
+from collections.abc import MutableSet
 from datetime import datetime, timedelta
+from email.utils import format_datetime
 
 from glassbox.ingestion.rss import (
     RSSItem,
@@ -19,12 +22,14 @@ from glassbox.ingestion.rss import (
     normalize_text,
     extract_domain_from_url,
     rss_item_to_signal,
+    source_type_for_feed,
     ingest_rss_item,
     ingest_rss_feed,
     IngestionResult,
     BatchIngestionResult,
 )
 from glassbox.domain import RejectionRule
+from glassbox.validation import create_dedup_hash
 
 
 # =============================================================================
@@ -93,6 +98,22 @@ EMPTY_RSS = """<?xml version="1.0" encoding="UTF-8"?>
 """
 
 
+def fresh_job_feed(*job_numbers: int) -> str:
+    """Hiring feed with one item per https://jobs.acme.com/job/<n>, dated now."""
+    pub_date = format_datetime(datetime.utcnow(), usegmt=False)
+    items = "".join(
+        f"""  <item>
+    <title>Engineer {n}</title>
+    <link>https://jobs.acme.com/job/{n}</link>
+    <description>We're hiring!</description>
+    <pubDate>{pub_date}</pubDate>
+  </item>
+"""
+        for n in job_numbers
+    )
+    return f'<rss version="2.0"><channel>\n{items}</channel></rss>'
+
+
 # =============================================================================
 # RSS PARSING TESTS
 # =============================================================================
@@ -109,6 +130,16 @@ class TestRSSParsing:
         assert items[0].link == "https://boards.greenhouse.io/acme/jobs/123"
         assert "hiring" in items[0].description.lower()
     
+    def test_parse_bytes_feed(self):
+        """Undecoded bytes parse using the feed's declared encoding."""
+        feed = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<rss version="2.0"><channel>
+  <item><title>Ingeniero Señor</title><link>https://acme.com/jobs/1</link></item>
+</channel></rss>""".encode("iso-8859-1")
+        items = list(parse_rss_feed(feed, "https://acme.com/feed"))
+        
+        assert [item.title for item in items] == ["Ingeniero Señor"]
+    
     def test_parse_malformed_xml_raises(self):
         """Malformed XML should raise RSSParseError."""
         with pytest.raises(RSSParseError, match="Invalid XML"):
@@ -119,6 +150,57 @@ class TestRSSParsing:
         with pytest.raises(RSSParseError, match="No items found"):
             list(parse_rss_feed(EMPTY_RSS, "https://example.com/feed"))
     
+    def test_parse_feed_without_channel(self):
+        """Feeds that put items directly under the root are still parsed."""
+        feed = """<rss version="2.0">
+  <item><title>Job</title><link>https://acme.com/jobs/1</link></item>
+  <item><title>No link</title></item>
+</rss>"""
+        items = list(parse_rss_feed(feed, "https://acme.com/feed"))
+        
+        assert [item.link for item in items] == ["https://acme.com/jobs/1"]
+    
+    def test_parse_ignores_items_outside_channel(self):
+        """With a <channel>, only its direct <item> children count."""
+        feed = """<rss version="2.0">
+  <channel>
+    <item><title>Job</title><link>https://acme.com/jobs/1</link></item>
+    <extra><item><title>Nested</title><link>https://acme.com/x</link></item></extra>
+  </channel>
+</rss>"""
+        items = list(parse_rss_feed(feed, "https://acme.com/feed"))
+        
+        assert [item.title for item in items] == ["Job"]
+    
+    def test_parse_only_first_channel(self):
+        """Items of a second <channel> are not part of the feed."""
+        feed = """<rss version="2.0">
+  <channel><item><title>A</title><link>https://acme.com/a</link></item></channel>
+  <channel><item><title>B</title><link>https://acme.com/b</link></item></channel>
+</rss>"""
+        items = list(parse_rss_feed(feed, "https://acme.com/feed"))
+        
+        assert [item.title for item in items] == ["A"]
+    
+    def test_parse_drops_root_items_when_channel_follows(self):
+        """Items before the <channel> are dropped once a channel opens."""
+        feed = """<rss version="2.0">
+  <item><title>Z</title><link>https://acme.com/z</link></item>
+  <channel><item><title>A</title><link>https://acme.com/a</link></item></channel>
+</rss>"""
+        items = list(parse_rss_feed(feed, "https://acme.com/feed"))
+        
+        assert [item.title for item in items] == ["A"]
+    
+    def test_truncated_feed_yields_then_raises(self):
+        """Items are streamed; a truncated tail still raises RSSParseError."""
+        truncated = VALID_RSS_FEED[: VALID_RSS_FEED.index("</item>") + len("</item>")]
+        parser = parse_rss_feed(truncated, "https://jobs.acme.com/feed")
+        
+        assert next(parser).title == "Senior Software Engineer"
+        with pytest.raises(RSSParseError, match="Invalid XML"):
+            next(parser)
+    
     def test_parse_date_rfc2822(self):
         """RSS pubDate in RFC 2822 format should parse correctly."""
         dt = parse_rss_date("Wed, 22 Jan 2026 10:00:00 GMT")
@@ -152,12 +234,25 @@ class TestNormalization:
         result = normalize_text(text)
         assert result == "Hello World"
     
+    def test_normalize_tags_separate_words(self):
+        """A tag between words is replaced by a space, not deleted."""
+        assert normalize_text("Senior<br/>Engineer<p>Remote</p>") == "Senior Engineer Remote"
+    
     def test_normalize_whitespace(self):
         """Multiple spaces should collapse to single space."""
         text = "Hello    World  \n\n  Test"
         result = normalize_text(text)
         assert result == "Hello World Test"
     
+    def test_normalize_collapses_unicode_whitespace(self):
+        """Tabs, newlines and Unicode spaces all collapse to one space."""
+        text = "\u00a0Senior\t\tEngineer\n\u2003(remote) \r\n"
+        assert normalize_text(text) == "Senior Engineer (remote)"
+    
+    def test_normalize_keeps_bare_angle_brackets(self):
+        """A '<' with no closing '>' is not a tag and is kept."""
+        assert normalize_text("Salary < 100k,  remote") == "Salary < 100k, remote"
+    
     def test_extract_domain_from_url(self):
         """Domain should be extracted from URL."""
         url = "https://boards.greenhouse.io/acme/jobs/123"
@@ -174,6 +269,12 @@ class TestNormalization:
         """Invalid URL should return None."""
         domain = extract_domain_from_url("not a url")
         assert domain is None
+    
+    def test_extract_domain_urlparse_edge_cases(self):
+        """Scheme-relative, padded and query-only URLs still resolve."""
+        assert extract_domain_from_url("//jobs.acme.com/feed") == "acme.com"
+        assert extract_domain_from_url(" https://jobs.acme.com/feed") == "acme.com"
+        assert extract_domain_from_url("https://jobs.acme.com?next=a.b/c") == "acme.com"
 
 
 # =============================================================================
@@ -217,6 +318,29 @@ class TestSignalConversion:
         
         assert signal.dedup_hash is not None
         assert len(signal.dedup_hash) == 64  # SHA-256 hex
+    
+    def test_source_type_for_feed(self):
+        """Feed source_type matches per-item derivation."""
+        assert source_type_for_feed("https://jobs.acme.com/feed") == "rss_acme.com"
+        assert source_type_for_feed("") == "rss_unknown"
+    
+    def test_source_type_for_feed_is_memoized(self):
+        """Repeat lookups for a feed hit the cache instead of re-parsing."""
+        source_type_for_feed.cache_clear()
+        for _ in range(3):
+            source_type_for_feed("https://boards.greenhouse.io/acme/feed")
+        
+        info = source_type_for_feed.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+    
+    def test_dedup_hash_is_stable_sha256(self):
+        """Dedup hash format is pinned; stored seen-hash sets depend on it."""
+        raw_text = "x" * 600
+        expected = hashlib.sha256(
+            f"https://jobs.acme.com/123:{raw_text[:500]}".encode()
+        ).hexdigest()
+        
+        assert create_dedup_hash("https://jobs.acme.com/123", raw_text) == expected
 
 
 # =============================================================================
@@ -243,6 +367,24 @@ class TestIngestionPipeline:
         assert result.signal is not None
         assert result.rejection is None
     
+    def test_gated_signal_keeps_converted_ids(self):
+        """Gating reuses the IDs computed during conversion."""
+        item = RSSItem(
+            title="Senior Software Engineer",
+            link="https://boards.greenhouse.io/acme/jobs/123",
+            description="We're hiring a talented engineer to join our team!",
+            pub_date=datetime.utcnow(),
+            guid="job-123",
+            feed_url="https://jobs.acme.com/feed",
+        )
+        converted = rss_item_to_signal(item)
+        
+        result = ingest_rss_item(item, converted)
+        
+        assert result.signal.signal_id == converted.signal_id
+        assert result.signal.dedup_hash == converted.dedup_hash
+        assert result.signal == ingest_rss_item(item).signal
+    
     def test_ingest_stale_signal_rejected(self):
         """Stale signal (> 30 days) should be rejected."""
         old_date = datetime.utcnow() - timedelta(days=45)
@@ -262,6 +404,23 @@ class TestIngestionPipeline:
         assert result.rejection is not None
         assert result.rejection.rule == RejectionRule.R2_STALE_SIGNAL
     
+    def test_ingest_item_uses_batch_now(self):
+        """Freshness and rejection time come from the caller's `now`."""
+        now = datetime(2026, 3, 1)
+        item = RSSItem(
+            title="Senior Software Engineer",
+            link="https://boards.greenhouse.io/acme/jobs/123",
+            description="We're hiring a talented engineer!",
+            pub_date=now - timedelta(days=31),
+            guid="job-123",
+            feed_url="https://jobs.acme.com/feed",
+        )
+        
+        result = ingest_rss_item(item, now=now)
+        
+        assert result.rejection.rule == RejectionRule.R2_STALE_SIGNAL
+        assert result.rejection.timestamp == now
+    
     def test_ingest_no_intent_rejected(self):
         """Signal without intent keywords should be rejected."""
         item = RSSItem(
@@ -343,6 +502,117 @@ class TestBatchIngestion:
         # Second run should have 0 new accepted (all skipped as dupes)
         assert len(result2.accepted) == 0
     
+    def test_deduplication_accepts_any_mutable_set(self):
+        """seen_hashes can be any MutableSet, e.g. a bounded one."""
+        class RecentHashes(MutableSet):
+            def __init__(self, limit):
+                self.limit = limit
+                self.items: dict[str, None] = {}
+            def __contains__(self, value):
+                return value in self.items
+            def __iter__(self):
+                return iter(self.items)
+            def __len__(self):
+                return len(self.items)
+            def add(self, value):
+                self.items[value] = None
+                if len(self.items) > self.limit:
+                    del self.items[next(iter(self.items))]
+            def discard(self, value):
+                self.items.pop(value, None)
+        
+        feed = fresh_job_feed(1)
+        
+        seen_hashes = RecentHashes(limit=10)
+        result1 = ingest_rss_feed(feed, "https://jobs.acme.com/feed", seen_hashes)
+        result2 = ingest_rss_feed(feed, "https://jobs.acme.com/feed", seen_hashes)
+        
+        assert len(result1.accepted) == 1
+        assert len(seen_hashes) == 1
+        assert len(result2.accepted) == 0
+    
+    def test_stored_dedup_hashes_seed_seen_set(self):
+        """Dedup hashes kept from an earlier run skip the same items."""
+        feed = fresh_job_feed(1)
+        
+        first = ingest_rss_feed(feed, "https://jobs.acme.com/feed")
+        stored = {signal.dedup_hash for signal in first.accepted}
+        second = ingest_rss_feed(feed, "https://jobs.acme.com/feed", stored)
+        
+        assert len(first.accepted) == 1
+        assert len(second.accepted) == 0
+    
+    def test_seen_items_skip_gating(self, monkeypatch):
+        """Items already in seen_hashes are dropped before they are gated."""
+        from glassbox.ingestion import rss
+        
+        feed = fresh_job_feed(1, 2, 3)
+        seen_hashes: set[str] = set()
+        ingest_rss_feed(feed, "https://jobs.acme.com/feed", seen_hashes)
+        
+        gated = []
+        original = rss.ingest_rss_item
+        monkeypatch.setattr(
+            rss, "ingest_rss_item",
+            lambda item, *args: gated.append(item) or original(item, *args),
+        )
+        result = ingest_rss_feed(
+            fresh_job_feed(1, 2, 3, 4), "https://jobs.acme.com/feed", seen_hashes,
+        )
+        
+        assert [item.link for item in gated] == ["https://jobs.acme.com/job/4"]
+        assert len(result.accepted) == 1
+    
+    def test_in_feed_repeats_keep_first(self):
+        """Ingestion keeps feed order and drops in-feed repeats."""
+        feed = fresh_job_feed(1, 2, 1, 3, 4, 2)
+        
+        result = ingest_rss_feed(feed, "https://jobs.acme.com/feed")
+        
+        assert result.total_items == 6
+        assert [s.source_url for s in result.accepted] == [
+            f"https://jobs.acme.com/job/{n}" for n in (1, 2, 3, 4)
+        ]
+    
+    def test_undated_items_share_batch_timestamp(self):
+        """Items without pubDate are stamped with one time per batch."""
+        feed = """<rss version="2.0"><channel>
+  <item><title>Hiring A</title><link>https://acme.com/jobs/1</link></item>
+  <item><title>Hiring B</title><link>https://acme.com/jobs/2</link></item>
+</channel></rss>"""
+        result = ingest_rss_feed(feed, "https://acme.com/feed")
+        
+        assert len(result.accepted) == 2
+        assert result.accepted[0].timestamp == result.accepted[1].timestamp
+    
+    def test_empty_item_is_rejected_not_raised(self):
+        """An item with a link but no text is a rejection, not a crash."""
+        feed = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0">
+  <channel>
+    <item>
+      <title></title>
+      <link>https://jobs.acme.com/job/empty</link>
+    </item>
+  </channel>
+</rss>
+"""
+        result = ingest_rss_feed(feed, "https://jobs.acme.com/feed")
+        
+        assert result.total_items == 1
+        assert len(result.accepted) == 0
+        assert result.rejected[0].rule == RejectionRule.R1_NO_INTENT_SIGNAL
+    
+    def test_truncated_feed_returns_empty(self):
+        """A feed that breaks part-way is rejected whole, not half-ingested."""
+        truncated = VALID_RSS_FEED[: VALID_RSS_FEED.index("</item>") + len("</item>")]
+        seen_hashes: set[str] = set()
+        
+        result = ingest_rss_feed(truncated, "https://jobs.acme.com/feed", seen_hashes)
+        
+        assert result.total_items == 0
+        assert not seen_hashes
+    
     def test_malformed_feed_returns_empty(self):
         """Malformed feed should return empty result, not crash."""
         result = ingest_rss_feed(MALFORMED_RSS, "https://broken.com/feed")
@@ -22,11 +22,17 @@ from glassbox.resolution.entity_resolver import (
     extract_company_name_from_signal,
     extract_domain_from_signal,
     check_for_ambiguity,
+    company_domains_in_text,
+    iter_resolutions,
     resolve_entity,
     resolve_signals,
     ResolutionResult,
     DomainValidationError,
     RejectionError,
+    BLOCKED_DOMAIN_REASONS,
+    JOB_BOARD_DOMAINS,
+    PERSONAL_EMAIL_DOMAINS,
+    URL_SHORTENER_DOMAINS,
 )
 
 
@@ -104,6 +110,21 @@ class TestDomainValidation:
         assert exc_info.value.rule == RejectionRule.R4_INVALID_DOMAIN
         assert "signal source" in exc_info.value.reason
     
+    def test_validate_domain_normalizes_input(self):
+        """The public validator still lowercases and strips its input."""
+        validate_domain("  Acme.COM ")  # Should not raise
+        
+        with pytest.raises(RejectionError) as exc_info:
+            validate_domain(" GMAIL.com")
+        assert "Personal email" in exc_info.value.reason
+    
+    def test_blocked_domain_reasons_cover_every_blocklist(self):
+        """Each blocklist entry has exactly one blocked reason."""
+        blocklists = [PERSONAL_EMAIL_DOMAINS, URL_SHORTENER_DOMAINS, JOB_BOARD_DOMAINS]
+        
+        assert sum(len(domains) for domains in blocklists) == len(BLOCKED_DOMAIN_REASONS)
+        assert set(BLOCKED_DOMAIN_REASONS) == set().union(*blocklists)
+    
     def test_normalize_domain(self):
         """Domain normalization should be consistent."""
         assert normalize_domain("ACME.COM") == "acme.com"
@@ -117,6 +138,13 @@ class TestDomainValidation:
         
         url = "https://www.acme.com/careers"
         assert extract_domain_from_url(url) == "acme.com"
+    
+    def test_extract_domain_from_url_deep_subdomain(self):
+        """Only the last two labels are kept; the port is dropped."""
+        url = "https://jobs.eu.acme.com:8443/careers"
+        assert extract_domain_from_url(url) == "acme.com"
+        
+        assert extract_domain_from_url("http://localhost/jobs") == "localhost"
 
 
 # =============================================================================
@@ -144,6 +172,12 @@ class TestCompanyNameExtraction:
         name = extract_company_name_from_signal(signal)
         assert name == "Acme Labs"
     
+    def test_pattern_priority_preserved(self):
+        """'is hiring' still wins over a later 'Join' in the same text."""
+        signal = make_signal("Acme Labs is hiring. Join Globex today!")
+        name = extract_company_name_from_signal(signal)
+        assert name == "Acme Labs"
+    
     def test_extract_from_url_slug(self):
         """Company slug from job board URL should work as fallback."""
         signal = make_signal(
@@ -190,6 +224,15 @@ class TestDomainExtraction:
         )
         domain = extract_domain_from_signal(signal)
         assert domain == "acme.com"
+    
+    def test_precomputed_text_domains_match(self):
+        """Passing the scanned text domains gives the same domain."""
+        signal = make_signal("Apply at Careers.ACME.com today")
+        text_domains = company_domains_in_text(signal.raw_text.lower())
+        
+        assert text_domains == {"acme.com"}
+        assert extract_domain_from_signal(signal, text_domains) == "acme.com"
+        assert extract_domain_from_signal(signal) == "acme.com"
 
 
 # =============================================================================
@@ -212,6 +255,24 @@ class TestAmbiguityDetection:
         assert result.is_ambiguous is True
         assert "Multiple domains" in result.reason
     
+    def test_repeated_indicator_counts_once(self):
+        """Repeats of one company phrase do not look like several companies."""
+        signal = make_signal("Engineer at Acme, based at HQ, at acme.com")
+        result = check_for_ambiguity(signal, "Acme", "acme.com")
+        assert result.is_ambiguous is False
+    
+    def test_subdomains_of_one_company_not_ambiguous(self):
+        """A subdomain and its root, or a job board host, are one company."""
+        for text in (
+            "Acme Corp is hiring! Apply at careers.acme.com or visit acme.com",
+            "Acme Corp is hiring! See acme.com or boards.greenhouse.io",
+        ):
+            signal = make_signal(text)
+            result = check_for_ambiguity(signal, "Acme Corp", "acme.com")
+            
+            assert result.is_ambiguous is False, text
+            assert resolve_entity(signal).success is True
+    
     def test_generic_name_without_domain_is_ambiguous(self):
         """Generic company name without domain = ambiguous."""
         signal = make_signal("The Company is hiring!")
@@ -366,6 +427,17 @@ class TestEvidenceLineage:
         # Check that inference rules are recorded
         assert result.entity.company_name.meta.inference_rule is not None
         assert result.entity.domain.meta.inference_rule is not None
+    
+    def test_domain_confidence_reflects_its_source(self):
+        """Domains named in the text outrank domains guessed from the URL."""
+        url = "https://boards.greenhouse.io/acme/jobs/123"
+        explicit = resolve_entity(make_signal("Acme Corp is hiring! See Careers.Acme.com", url))
+        inferred = resolve_entity(make_signal("Acme Corp is hiring!", url))
+        
+        assert explicit.entity.domain.meta.inference_rule == "explicit_domain_extraction"
+        assert explicit.entity.domain.meta.confidence == 0.85
+        assert inferred.entity.domain.meta.inference_rule == "domain_inference_from_url_slug"
+        assert inferred.entity.domain.meta.confidence == 0.60
 
 
 # =============================================================================
@@ -394,6 +466,26 @@ class TestBatchResolution:
         assert len(result.resolved) == 2
         assert len(result.rejected) == 0
     
+    def test_batch_evidence_shares_timestamp(self):
+        """All Evidence created in one batch carries one timestamp."""
+        signals = [
+            make_signal(
+                f"Co{i} is hiring!",
+                source_url=f"https://boards.greenhouse.io/co{i}/jobs/{i}"
+            )
+            for i in range(3)
+        ]
+        
+        result = resolve_signals(signals)
+        
+        timestamps = {
+            evidence.meta.timestamp
+            for entity in result.resolved
+            for evidence in (entity.company_name, entity.domain)
+        }
+        assert len(result.resolved) == 3
+        assert len(timestamps) == 1
+    
     def test_batch_handles_mixed_signals(self):
         """Batch should handle mix of valid and invalid signals."""
         signals = [
@@ -413,6 +505,56 @@ class TestBatchResolution:
         assert len(result.resolved) == 1
         assert len(result.rejected) == 1
     
+    def test_batch_rejections_share_timestamp(self):
+        """Rejections carry the batch timestamp, like resolved Evidence."""
+        signals = [
+            make_signal("We need help!", source_url="https://example.com/jobs"),
+            make_signal("Acme Corp is hiring!"),
+        ]
+        
+        result = resolve_signals(signals)
+        
+        assert len(result.rejected) == 1
+        assert result.rejected[0].timestamp == result.resolved[0].domain.meta.timestamp
+    
+    def test_iter_resolutions_streams_lazily(self):
+        """Signals are resolved only as results are consumed."""
+        consumed = []
+        
+        def signal_source():
+            for i in range(3):
+                consumed.append(i)
+                yield make_signal(
+                    f"Co{i} is hiring!",
+                    source_url=f"https://boards.greenhouse.io/co{i}/jobs/{i}",
+                )
+        
+        results = iter_resolutions(signal_source())
+        first = next(results)
+        
+        assert consumed == [0]
+        assert first.success and first.entity.get_domain_value() == "co0.com"
+        assert [r.entity.get_domain_value() for r in results] == ["co1.com", "co2.com"]
+    
+    def test_recrawled_duplicates_keep_their_own_audit_trail(self):
+        """Same content crawled twice is rejected under each signal's ID."""
+        from datetime import timedelta
+        
+        first = make_signal("We need help!", source_url="https://example.com/jobs")
+        again = make_signal(
+            "We need help!",
+            source_url="https://example.com/jobs",
+            timestamp=first.timestamp + timedelta(hours=1),
+        )
+        
+        result = resolve_signals([first, again])
+        
+        assert first.dedup_hash == again.dedup_hash
+        assert [r.signal_id for r in result.rejected] == [
+            first.signal_id, again.signal_id,
+        ]
+        assert result.rejected[0].rejection_id != result.rejected[1].rejection_id
+    
     def test_batch_rejection_has_audit_trail(self):
         """Batch rejections should have full audit information."""
         signals = [
@@ -431,6 +573,24 @@ class TestBatchResolution:
         assert rejection.rule is not None
         assert rejection.reason is not None
         assert rejection.timestamp is not None
+    
+    def test_batch_tracks_source_signal_per_entity(self):
+        """Each resolved Entity should be paired with its own Signal."""
+        signals = [
+            make_signal(
+                "We need help!",  # No company name, rejected
+                source_url="https://example.com/jobs"
+            ),
+            make_signal(
+                "TechCo is hiring engineers!",
+                source_url="https://boards.greenhouse.io/techco/jobs/2"
+            ),
+        ]
+        
+        result = resolve_signals(signals)
+        
+        assert len(result.resolved) == 1
+        assert result.resolved_signals == [signals[1]]
 
 
 # =============================================================================
@@ -22,6 +22,8 @@ from glassbox.enrichment.waterfall import (
     enrich_entity,
     enrich_entities,
     EnrichmentResult,
+    GENERIC_TLDS,
+    TLD_COUNTRY_MAP,
 )
 
 
@@ -123,6 +125,16 @@ class TestIndustryInference:
         # Multiple matches = ambiguous = None
         assert evidence is None
     
+    def test_overlapping_keywords_all_count(self):
+        """Keywords inside other keywords still match ("fintech" has "tech")."""
+        evidence = infer_industry(
+            "The leading fintech company",
+            "evt_source123",
+        )
+        
+        # fintech + technology = ambiguous = None
+        assert evidence is None
+    
     def test_no_industry_for_generic_text(self):
         """Text without industry keywords should return None."""
         evidence = infer_industry(
@@ -171,6 +183,15 @@ class TestCompanySizeInference:
         assert evidence is not None
         assert evidence.value == "enterprise"
     
+    def test_no_size_for_ambiguous_text(self):
+        """Indicators from more than one size range should return None."""
+        evidence = infer_company_size_range(
+            "Seed-funded startup partnering with a Fortune 500 enterprise",
+            "evt_source123",
+        )
+        
+        assert evidence is None
+    
     def test_no_size_for_generic_text(self):
         """Text without size indicators should return None."""
         evidence = infer_company_size_range(
@@ -218,6 +239,23 @@ class TestCountryInference:
         
         evidence = infer_country_from_domain("nodot", "evt_source123")
         assert evidence is None
+        
+        evidence = infer_country_from_domain("trailing.", "evt_source123")
+        assert evidence is None
+    
+    def test_generic_tlds_never_map_to_country(self):
+        """No generic TLD may also appear in the country map."""
+        assert GENERIC_TLDS.isdisjoint(TLD_COUNTRY_MAP)
+        for tld in GENERIC_TLDS:
+            assert infer_country_from_domain(f"company.{tld}", "evt_source123") is None
+    
+    def test_country_uses_last_label_only(self):
+        """Only the final label counts; uppercase TLDs still map."""
+        evidence = infer_country_from_domain("shop.de.example.COM", "evt_source123")
+        assert evidence is None
+        
+        evidence = infer_country_from_domain("Company.CO.UK", "evt_source123")
+        assert evidence.value == "United Kingdom"
 
 
 # =============================================================================
@@ -255,6 +293,18 @@ class TestEntityEnrichment:
         # Entity remains valid
         assert result.entity is not None
     
+    def test_enrichment_matches_standalone_inference(self):
+        """enrich_entity must agree with infer_industry/infer_company_size_range."""
+        text = "Early-stage STARTUP building a SaaS platform, hiring now!"
+        entity = make_entity("TechCorp", "techcorp.com")
+    
+        enrich_entity(entity, make_signal(text))
+    
+        industry = infer_industry(text, "evt_x")
+        size = infer_company_size_range(text, "evt_x")
+        assert entity.industry.value == industry.value == "technology"
+        assert entity.size_estimate.value == size.value == "startup"
+    
     def test_enrichment_failure_preserves_entity(self):
         """Failed enrichment should not modify or reject Entity."""
         entity = make_entity("SimpleCo", "simpleco.com")
@@ -406,6 +456,33 @@ class TestBatchEnrichment:
         assert len(results) == 2
         # Second entity has all text-based enrichments failed
         assert "industry" in results[1].failed_fields
+    
+    def test_batch_evidence_shares_timestamp(self):
+        """Evidence created in one batch carries a single timestamp."""
+        entities = [
+            make_entity("TechCo", "techco.com"),
+            make_entity("HealthCo", "healthco.uk"),
+        ]
+        signals = [
+            make_signal("Early-stage startup building SaaS software"),
+            make_signal("HealthCo improves patient care"),
+        ]
+        
+        enrich_entities(entities, signals)
+        
+        timestamps = {
+            entities[0].industry.meta.timestamp,
+            entities[0].size_estimate.meta.timestamp,
+            entities[1].industry.meta.timestamp,
+        }
+        assert len(timestamps) == 1
+    
+    def test_explicit_timestamp_is_used(self):
+        """A caller-supplied timestamp is stamped on inferred Evidence."""
+        ts = datetime(2026, 1, 5, 12, 0, 0)
+        
+        assert infer_industry("SaaS platform", "evt_x", ts).meta.timestamp == ts
+        assert infer_country_from_domain("acme.de", "evt_x", ts).meta.timestamp == ts
 
 
 # =============================================================================
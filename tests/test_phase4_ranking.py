@@ -31,6 +31,7 @@ from glassbox.ranking.scorer import (
     ScoreBreakdown,
     RankedLead,
     generate_explanation,
+    TIER_SUMMARIES,
 )
 
 
@@ -130,12 +131,27 @@ class TestIntentStrength:
         assert score.contribution == 30
         assert "funding" in score.reason.lower()
     
+    def test_keywords_match_as_substrings(self):
+        """Keywords match inside longer words ("engineering" has "engineer")."""
+        signal = make_signal("Acme expands its ENGINEERING organisation")
+        score = compute_intent_strength(signal=signal)
+        
+        assert score.contribution == 40
+    
     def test_no_signal_zero_score(self):
         """No signal should get 0 points."""
         score = compute_intent_strength(signal=None)
         
         assert score.contribution == 0
         assert len(score.evidence_ids) == 0
+    
+    def test_hiring_outranks_funding(self):
+        """Text with hiring and funding keywords is scored as hiring."""
+        signal = make_signal("Fresh off our Series B, we're hiring!")
+        score = compute_intent_strength(signal=signal)
+        
+        assert score.contribution == 40
+        assert "hiring" in score.reason
 
 
 # =============================================================================
@@ -174,6 +190,34 @@ class TestSignalFreshness:
         
         assert score.contribution == 0
         assert "stale" in score.reason.lower()
+    
+    def test_bin_boundaries_inclusive(self):
+        """Each bin's upper day count still earns that bin's points."""
+        signal = make_signal("Hiring now!")
+        expected = {
+            3: 25, 4: 20, 7: 20, 8: 15, 14: 15, 15: 10,
+            21: 10, 22: 5, 30: 5, 31: 0,
+        }
+        
+        for days, points in expected.items():
+            reference_time = signal.timestamp + timedelta(days=days)
+            score = compute_signal_freshness(signal, reference_time)
+            
+            assert score.contribution == points, days
+            assert score.raw_value == days
+        
+        assert score.reason == (
+            "Stale signal (31 days old, no freshness bonus) (+0 points)"
+        )
+    
+    def test_partial_days_are_floored(self):
+        """A signal 3 days and 23 hours old is still 3 days old."""
+        signal = make_signal("Hiring now!")
+        reference_time = signal.timestamp + timedelta(days=3, hours=23)
+        score = compute_signal_freshness(signal, reference_time)
+        
+        assert score.raw_value == 3
+        assert score.contribution == 25
 
 
 # =============================================================================
@@ -205,6 +249,24 @@ class TestEvidenceConfidence:
         
         # 0.35 is in range [0.2, 0.4) which is "Low" = 5 points
         assert score.contribution == 5
+    
+    def test_confidence_level_boundaries(self):
+        """Thresholds are inclusive; below 0.2 scores nothing."""
+        expected = [
+            (0.8, 20), (0.6, 15), (0.4, 10), (0.2, 5), (0.19, 0), (0.0, 0),
+        ]
+        for confidence, points in expected:
+            score = compute_evidence_confidence(make_entity(confidence=confidence))
+            assert score.contribution == points, confidence
+    
+    def test_minimum_confidence_wins(self):
+        """The weakest Evidence sets the level; all IDs are reported."""
+        entity = make_entity(confidence=0.9, with_industry=True, with_size=True)
+        score = compute_evidence_confidence(entity)
+        
+        assert score.raw_value == 0.65  # size_estimate
+        assert score.contribution == 15
+        assert len(score.evidence_ids) == 4
 
 
 # =============================================================================
@@ -255,6 +317,16 @@ class TestNoisePenalty:
         
         assert score.contribution < 0
         assert "uncertainty" in score.reason.lower()
+    
+    def test_noise_counts_distinct_markers(self):
+        """Repeating one marker counts once; three distinct markers cost -10."""
+        repeated = compute_noise_penalty(signal=make_signal("maybe maybe maybe hiring"))
+        distinct = compute_noise_penalty(signal=make_signal("Maybe, possibly, TBD: hiring"))
+        
+        assert repeated.raw_value == 1.0
+        assert repeated.contribution == -5.0
+        assert distinct.raw_value == 3.0
+        assert distinct.contribution == -10.0
 
 
 # =============================================================================
@@ -365,6 +437,32 @@ class TestExplanation:
         
         # Should have score breakdown section
         assert "Score Breakdown" in explanation or "Breakdown" in explanation
+    
+    def test_explanation_layout(self):
+        """Header, one line per component, summary, then any concerns."""
+        entity = make_entity("TechCo", "techco.com")
+        signal = make_signal("TechCo is hiring engineers!")
+        
+        ranked = score_lead(entity, signal)
+        components = ranked.breakdown.components
+        lines = ranked.get_explanation().split("\n")
+        
+        assert lines[0].startswith("**TechCo** is ranked as Tier ")
+        assert lines[1:3] == ["", "**Score Breakdown:**"]
+        assert lines[3:3 + len(components)] == [f"- {c.reason}" for c in components]
+        assert lines[3 + len(components)] == ""
+        assert lines[4 + len(components)].startswith("**Summary:** ")
+        
+        concerns = lines[5 + len(components):]
+        if ranked.breakdown.get_negative_contributors():
+            assert concerns[0] == "" and concerns[1].startswith("**Concerns:** ")
+        else:
+            assert concerns == []
+    
+    def test_every_tier_has_a_summary(self):
+        """Each tier maps to its own summary sentence."""
+        assert set(TIER_SUMMARIES) == set(LeadTier)
+        assert len(set(TIER_SUMMARIES.values())) == len(LeadTier)
 
 
 # =============================================================================
@@ -393,6 +491,27 @@ class TestRankingStability:
         scores = [r.score for r in ranked]
         assert scores == sorted(scores, reverse=True)
     
+    def test_top_k_matches_full_ranking_prefix(self):
+        """top_k returns the same leads, in the same order, as the full ranking."""
+        entities = [make_entity(f"Co{i}", f"co{i}.com") for i in range(6)]
+        signals = [
+            make_signal("Regular update", days_ago=20),
+            make_signal("We're hiring engineers!", days_ago=0),
+            make_signal("Company news", days_ago=10),
+            make_signal("We're hiring engineers!", days_ago=0),  # Ties with Co1
+            make_signal("Raised a Series A", days_ago=2),
+            make_signal("Company news", days_ago=10),
+        ]
+        reference_time = datetime.utcnow()
+        
+        full = score_leads(entities, signals, reference_time)
+        top = score_leads(entities, signals, reference_time, top_k=3)
+        
+        assert [r.entity.get_name_value() for r in top] == [
+            r.entity.get_name_value() for r in full[:3]
+        ]
+        assert len(score_leads(entities, signals, reference_time, top_k=10)) == 6
+    
     def test_same_order_every_time(self):
         """Ranking order should be consistent."""
         entities = [
@@ -9,6 +9,8 @@ These tests verify:
 """
 
 import pytest
+from datetime import datetime
+from email.utils import format_datetime
 from io import StringIO
 import sys
 
@@ -30,6 +32,33 @@ from glassbox.cli.main import (
 from glassbox.ranking.scorer import LeadTier
 
 
+# =============================================================================
+# TEST FIXTURES
+# =============================================================================
+
+def fresh_rss(*items: tuple[str, str, str]) -> str:
+    """RSS feed of (title, link, description) items, all dated now."""
+    now = format_datetime(datetime.utcnow(), usegmt=False)
+    body = "".join(
+        f"<item><title>{title}</title><link>{link}</link>"
+        f"<description>{description}</description>"
+        f"<pubDate>{now}</pubDate></item>"
+        for title, link, description in items
+    )
+    return f'<rss version="2.0"><channel>{body}</channel></rss>'
+
+
+# Two CloudCo postings rank as two leads sharing one domain (and lead ID)
+TWO_COMPANY_ITEMS = (
+    ("Engineer at CloudCo", "https://boards.greenhouse.io/cloudco/jobs/789",
+     "CloudCo is hiring!"),
+    ("Designer at CloudCo", "https://boards.greenhouse.io/cloudco/jobs/790",
+     "CloudCo is hiring a designer for our fintech team!"),
+    ("Engineer at DataCo", "https://boards.greenhouse.io/dataco/jobs/1",
+     "DataCo is hiring for our banking team!"),
+)
+
+
 # =============================================================================
 # PIPELINE TESTS
 # =============================================================================
@@ -71,6 +100,19 @@ class TestPipeline:
         # Rejections list should exist (may be empty)
         assert isinstance(result.rejections, list)
     
+    def test_pipeline_skips_signals_seen_in_earlier_runs(self):
+        """Signals already seen should not be resolved again."""
+        rss_xml = fresh_rss(TWO_COMPANY_ITEMS[0])
+        
+        seen: set[str] = set()
+        first = run_pipeline(rss_xml, seen_hashes=seen)
+        second = run_pipeline(rss_xml, seen_hashes=seen)
+        
+        assert first.signals_accepted == 1
+        assert len(seen) == 1
+        assert second.signals_accepted == 0
+        assert second.ranked_leads == []
+    
     def test_pipeline_generates_lead_ids(self):
         """Pipeline should generate stable lead IDs."""
         result = run_pipeline()
@@ -86,6 +128,87 @@ class TestPipeline:
                 assert isinstance(lead_id, str)
                 assert len(lead_id) > 0
 
+    def test_lead_ids_stable_across_runs(self):
+        """The same domain should always map to the same lead ID."""
+        from glassbox.cli.pipeline import _lead_id_for_domain
+        
+        feed = fresh_rss(*TWO_COMPANY_ITEMS)
+        first = run_pipeline(feed).get_lead_ids()
+        ids1 = [lid for lid, _ in first]
+        ids2 = [lid for lid, _ in run_pipeline(feed).get_lead_ids()]
+        
+        assert ids1 and ids1 == ids2
+        assert {lead.entity.get_domain_value() for _, lead in first} == {
+            "cloudco.com", "dataco.com",
+        }
+        for lead_id, lead in first:
+            assert lead_id == _lead_id_for_domain(lead.entity.get_domain_value())
+        # 4-byte blake2b digest of the domain, as 8 hex chars
+        assert _lead_id_for_domain("cloudco.com") == "b079890e"
+        assert _lead_id_for_domain("dataco.com") == "9ce91b5f"
+    
+    def test_get_lead_by_id(self):
+        """Each ID resolves to its highest-ranked lead; misses give None."""
+        result = run_pipeline(fresh_rss(*TWO_COMPANY_ITEMS))
+        lead_ids = result.get_lead_ids()
+        
+        assert len(lead_ids) == 3
+        first_by_id = {}
+        for lead_id, lead in lead_ids:
+            first_by_id.setdefault(lead_id, lead)
+        assert len(first_by_id) == 2  # CloudCo's two leads share an ID
+        
+        for lead_id, lead in lead_ids:
+            assert result.get_lead_by_id(lead_id) is first_by_id[lead_id]
+        
+        assert result.get_lead_by_id("not-a-lead") is None
+    
+    def test_rendered_views_built_once(self):
+        """Rendered views should be cached on the result."""
+        result = run_pipeline()
+        calls = []
+
+        def render():
+            calls.append(1)
+            return "view"
+
+        assert result.get_rendered("test_view", render) == "view"
+        assert result.get_rendered("test_view", render) == "view"
+        assert len(calls) == 1
+
+    def test_enrich_batch_preserves_order(self):
+        """Batch enrichment pairs each entity with its signal, in order."""
+        from datetime import datetime
+        from glassbox.cli import pipeline
+        from glassbox.domain import Signal
+        from glassbox.resolution.entity_resolver import resolve_signals
+
+        texts = [
+            "Co{} is hiring for our banking team!",
+            "Co{} is hiring for our hospital team!",
+        ]
+        signals = []
+        for i in range(6):
+            url = f"https://boards.greenhouse.io/co{i}/jobs/{i}"
+            signals.append(Signal(
+                signal_id=f"sig_{i}",
+                source_url=url,
+                raw_text=texts[i % 2].format(i),
+                timestamp=datetime.utcnow(),
+                source_type="rss_greenhouse.io",
+                dedup_hash=f"hash_{i}",
+            ))
+        resolved = resolve_signals(signals)
+
+        entities = pipeline.enrich_batch(
+            resolved.resolved, resolved.resolved_signals,
+        )
+
+        assert entities == resolved.resolved
+        assert [e.industry.value for e in entities] == (
+            ["fintech", "healthcare"] * 3
+        )
+
 
 # =============================================================================
 # CLI COMMAND TESTS
@@ -139,6 +262,76 @@ class TestCLICommands:
         assert "Run 'glassbox run' first" in captured.out
 
 
+# =============================================================================
+# LAST-RUN CACHE TESTS
+# =============================================================================
+
+class TestResultStore:
+    """Test the last-run cache shared between CLI invocations."""
+    
+    def test_result_survives_new_store(self, tmp_path):
+        """A fresh store (new process) should read the cached result."""
+        from glassbox.cli.pipeline import ResultStore
+        
+        path = tmp_path / "last_result.pkl"
+        result = run_pipeline()
+        ResultStore(path).set(result)
+        
+        loaded = ResultStore(path).get()
+        
+        assert isinstance(loaded, PipelineResult)
+        assert loaded.run_timestamp == result.run_timestamp
+        assert (
+            [lid for lid, _ in loaded.get_lead_ids()]
+            == [lid for lid, _ in result.get_lead_ids()]
+        )
+    
+    def test_clearing_removes_cache_file(self, tmp_path):
+        """Storing None should clear both memory and the cache file."""
+        from glassbox.cli.pipeline import ResultStore
+        
+        path = tmp_path / "last_result.pkl"
+        store = ResultStore(path)
+        store.set(run_pipeline())
+        store.set(None)
+        
+        assert not path.exists()
+        assert store.get() is None
+        assert ResultStore(path).get() is None
+    
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        """An unreadable cache file should behave like no result."""
+        from glassbox.cli.pipeline import ResultStore
+        
+        path = tmp_path / "last_result.pkl"
+        path.write_bytes(b"not a pickle")
+        path.chmod(0o600)
+        
+        assert ResultStore(path).get() is None
+    
+    def test_cache_file_is_owner_only(self, tmp_path):
+        """The cache directory and file are created private to the user."""
+        from glassbox.cli.pipeline import ResultStore
+        
+        path = tmp_path / "glassbox" / "last_result.pkl"
+        ResultStore(path).set(run_pipeline())
+        
+        assert path.stat().st_mode & 0o777 == 0o600
+        assert path.parent.stat().st_mode & 0o777 == 0o700
+    
+    def test_shared_cache_file_is_not_loaded(self, tmp_path):
+        """A cache file others can access is never unpickled."""
+        from glassbox.cli.pipeline import ResultStore
+        
+        path = tmp_path / "last_result.pkl"
+        ResultStore(path).set(run_pipeline())
+        path.chmod(0o666)
+        
+        assert ResultStore(path).get() is None
+        path.chmod(0o600)
+        assert isinstance(ResultStore(path).get(), PipelineResult)
+
+
 # =============================================================================
 # OUTPUT FORMATTING TESTS
 # =============================================================================
@@ -152,6 +345,11 @@ class TestOutputFormatting:
         assert format_tier_badge(LeadTier.TIER_B) == "[B-TIER]"
         assert format_tier_badge(LeadTier.TIER_C) == "[C-TIER]"
         assert format_tier_badge(LeadTier.TIER_D) == "[D-TIER]"
+
+    def test_tier_badge_property(self):
+        """Each tier should expose its badge directly."""
+        for tier in LeadTier:
+            assert tier.badge == f"[{tier.value}-TIER]"
     
     def test_lead_row_contains_key_info(self):
         """Lead row should contain company, score, and ID."""
@@ -284,13 +482,11 @@ class TestArgparse:
         """Parser should have all required commands."""
         parser = create_parser()
         
-        # Check subparsers exist
-        subparsers = parser._subparsers._actions[1].choices
-        
-        assert 'run' in subparsers
-        assert 'leads' in subparsers
-        assert 'explain' in subparsers
-        assert 'evidence' in subparsers
+        assert parser.parse_args(['run']).command == 'run'
+        assert parser.parse_args(['leads']).command == 'leads'
+        assert parser.parse_args(['explain', 'abc']).lead_id == 'abc'
+        assert parser.parse_args(['evidence', 'abc']).lead_id == 'abc'
+        assert '{run,leads,explain,evidence}' in parser.format_help()
     
     def test_explain_requires_lead_id(self):
         """Explain command should require lead_id argument."""
@@ -304,10 +500,63 @@ class TestArgparse:
         """Evidence command should require lead_id argument."""
         parser = create_parser()
         
-        # This should fail without lead_id  
+        # This should fail without lead_id
         with pytest.raises(SystemExit):
             parser.parse_args(['evidence'])
 
+    def test_parser_builds_only_requested_command(self):
+        """A known command should only register its own subparser."""
+        parser = create_parser("explain")
+        
+        assert parser.parse_args(['explain', 'abc123']).lead_id == 'abc123'
+        assert '{explain}' in parser.format_help()
+        with pytest.raises(SystemExit):
+            parser.parse_args(['run'])
+
+    def test_fast_path_matches_argparse(self):
+        """Fast-path dispatch should produce the same args as argparse."""
+        from glassbox.cli.main import parse_fast_path
+
+        for argv in (['run'], ['leads'], ['explain', 'abc'], ['evidence', 'abc']):
+            fast = parse_fast_path(argv)
+            full = create_parser().parse_args(argv)
+            assert vars(fast) == vars(full)
+
+    def test_fast_path_defers_to_argparse(self):
+        """Flags and malformed commands should fall through to argparse."""
+        from glassbox.cli.main import parse_fast_path
+
+        for argv in ([], ['--help'], ['run', '-h'], ['explain'],
+                     ['explain', 'a', 'b'], ['evidence', '--x'], ['bogus']):
+            assert parse_fast_path(argv) is None
+
+    def test_parser_is_cached_for_main_only(self):
+        """main() reuses parsers; create_parser hands out fresh ones."""
+        from glassbox.cli.main import _cached_parser
+        
+        assert _cached_parser("run") is _cached_parser("run")
+        assert _cached_parser("run") is not _cached_parser(None)
+        assert create_parser() is not create_parser()
+    
+    def test_unknown_commands_share_one_cached_parser(self, capsys):
+        """Typos map to the full parser instead of growing the cache."""
+        from glassbox.cli.main import _cached_parser
+        
+        _cached_parser.cache_clear()
+        for typo in ('bogus', 'lead', 'runn'):
+            with pytest.raises(SystemExit):
+                main([typo])
+        
+        assert _cached_parser.cache_info().currsize == 1
+        assert "invalid choice: 'runn'" in capsys.readouterr().err
+    
+    def test_parser_unknown_command_registers_all(self):
+        """Unknown commands fall back to the full parser for help/errors."""
+        parser = create_parser("bogus")
+        
+        assert '{run,leads,explain,evidence}' in parser.format_help()
+        assert parser.parse_args(['evidence', 'abc']).lead_id == 'abc'
+
 
 # =============================================================================
 # RUN TESTS